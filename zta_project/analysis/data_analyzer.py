@@ -4,9 +4,22 @@ Data Analysis Module for ZTA Research
 import numpy as np
 import pandas as pd
 from scipy import stats
+from functools import cached_property
 from typing import Dict, List, Tuple
 from datetime import datetime
 
+# Source statistics memoized by the analyzer; see DataAnalyzer.refresh
+CACHED_STATS = ('breach_stats', 'access_stats', 'device_stats', 'auth_stats', 'usability_metrics')
+
+
+def _summary(values: np.ndarray, fields: Tuple[str, ...]) -> Dict:
+    """Selected summary statistics of a sample, all 0 when it is empty"""
+    if not values.size:
+        return dict.fromkeys(fields, 0)
+    summary = {'mean': values.mean(), 'median': np.median(values), 'std_dev': values.std(),
+               'min': values.min(), 'max': values.max()}
+    return {field: summary[field] for field in fields}
+
 
 class DataAnalyzer:
     """Analyzes ZTA implementation data and generates insights"""
@@ -15,7 +28,33 @@ class DataAnalyzer:
         self.environment = environment
         self.breach_simulator = breach_simulator
         self.usability_tester = usability_tester
-        
+    
+    # The analyzer runs once the simulation is over, so each source is aggregated only once
+    @cached_property
+    def breach_stats(self) -> Dict:
+        return self.breach_simulator.get_breach_statistics()
+    
+    @cached_property
+    def access_stats(self) -> Dict:
+        return self.environment.access_controller.get_access_statistics()
+    
+    @cached_property
+    def device_stats(self) -> Dict:
+        return self.environment.device_manager.get_compliance_statistics()
+    
+    @cached_property
+    def auth_stats(self) -> Dict:
+        return self.environment.identity_manager.get_authentication_stats()
+    
+    @cached_property
+    def usability_metrics(self) -> Dict:
+        return self.usability_tester.get_usability_metrics()
+    
+    def refresh(self):
+        """Drop the memoized source statistics after the simulation data changes"""
+        for name in CACHED_STATS:
+            self.__dict__.pop(name, None)
+    
     def analyze_security_effectiveness(self) -> Dict:
         """Analyze security effectiveness metrics"""
         print("\n" + "=" * 70)
@@ -23,16 +62,16 @@ class DataAnalyzer:
         print("=" * 70)
         
         # Get breach statistics
-        breach_stats = self.breach_simulator.get_breach_statistics()
+        breach_stats = self.breach_stats
         
         # Get access control statistics
-        access_stats = self.environment.access_controller.get_access_statistics()
+        access_stats = self.access_stats
         
         # Get device compliance statistics
-        device_stats = self.environment.device_manager.get_compliance_statistics()
+        device_stats = self.device_stats
         
         # Get authentication statistics
-        auth_stats = self.environment.identity_manager.get_authentication_stats()
+        auth_stats = self.auth_stats
         
         # Calculate security score (0-100)
         security_score = self._calculate_security_score(
@@ -82,7 +121,7 @@ class DataAnalyzer:
         print("ANALYZING USABILITY IMPACT")
         print("=" * 70)
         
-        usability_metrics = self.usability_tester.get_usability_metrics()
+        usability_metrics = self.usability_metrics
         
         # Calculate usability score (0-100)
         usability_score = self._calculate_usability_score(usability_metrics)
@@ -142,10 +181,10 @@ class DataAnalyzer:
         }
         
         # Get ZTA metrics
-        breach_stats = self.breach_simulator.get_breach_statistics()
-        device_stats = self.environment.device_manager.get_compliance_statistics()
-        auth_stats = self.environment.identity_manager.get_authentication_stats()
-        access_stats = self.environment.access_controller.get_access_statistics()
+        breach_stats = self.breach_stats
+        device_stats = self.device_stats
+        auth_stats = self.auth_stats
+        access_stats = self.access_stats
         
         zta_metrics = {
             'breach_prevention_rate': breach_stats['prevention_rate'],
@@ -189,50 +228,43 @@ class DataAnalyzer:
         
         # Analyze authentication success rates
         auth_logs = self.environment.identity_manager.authentication_logs
-        auth_success = [1 if log['success'] else 0 for log in auth_logs]
+        auth_success = np.fromiter((log.success for log in auth_logs), dtype=np.float64, count=len(auth_logs))
         
         # Analyze access control decisions
         access_logs = self.environment.access_controller.access_logs
-        access_granted = [1 if log['granted'] else 0 for log in access_logs]
+        access_granted = np.fromiter((log['granted'] for log in access_logs), dtype=np.float64,
+                                     count=len(access_logs))
         
         # Analyze device trust scores
         devices = self.environment.devices if isinstance(self.environment.devices, list) else self.environment.devices.values()
-        device_trust_scores = [d.trust_score for d in devices]
+        device_trust_scores = np.fromiter((d.trust_score for d in devices), dtype=np.int64, count=len(devices))
         
         # Analyze user risk scores
-        user_risk_scores = [u.risk_score for u in self.environment.users]
+        users = self.environment.users
+        user_risk_scores = np.fromiter((u.risk_score for u in users), dtype=np.int64, count=len(users))
         
         # Analyze task completion times
-        task_times = [t['time_taken'] for t in self.usability_tester.task_completion_data]
+        task_data = self.usability_tester.task_completion_data
+        task_times = np.fromiter((t['time_taken'] for t in task_data), dtype=np.float64, count=len(task_data))
         
         results = {
             'authentication': {
-                'mean_success_rate': np.mean(auth_success) if auth_success else 0,
-                'std_dev': np.std(auth_success) if auth_success else 0,
-                'sample_size': len(auth_success)
+                'mean_success_rate': auth_success.mean() if auth_success.size else 0,
+                'std_dev': auth_success.std() if auth_success.size else 0,
+                'sample_size': auth_success.size
             },
             'access_control': {
-                'mean_grant_rate': np.mean(access_granted) if access_granted else 0,
-                'std_dev': np.std(access_granted) if access_granted else 0,
-                'sample_size': len(access_granted)
-            },
-            'device_trust': {
-                'mean': np.mean(device_trust_scores) if device_trust_scores else 0,
-                'median': np.median(device_trust_scores) if device_trust_scores else 0,
-                'std_dev': np.std(device_trust_scores) if device_trust_scores else 0,
-                'min': np.min(device_trust_scores) if device_trust_scores else 0,
-                'max': np.max(device_trust_scores) if device_trust_scores else 0
-            },
-            'user_risk': {
-                'mean': np.mean(user_risk_scores) if user_risk_scores else 0,
-                'median': np.median(user_risk_scores) if user_risk_scores else 0,
-                'std_dev': np.std(user_risk_scores) if user_risk_scores else 0
+                'mean_grant_rate': access_granted.mean() if access_granted.size else 0,
+                'std_dev': access_granted.std() if access_granted.size else 0,
+                'sample_size': access_granted.size
             },
+            'device_trust': _summary(device_trust_scores, ('mean', 'median', 'std_dev', 'min', 'max')),
+            'user_risk': _summary(user_risk_scores, ('mean', 'median', 'std_dev')),
             'task_completion': {
-                'mean_time': np.mean(task_times) if task_times else 0,
-                'median_time': np.median(task_times) if task_times else 0,
-                'std_dev': np.std(task_times) if task_times else 0,
-                'percentile_95': np.percentile(task_times, 95) if task_times else 0
+                'mean_time': task_times.mean() if task_times.size else 0,
+                'median_time': np.median(task_times) if task_times.size else 0,
+                'std_dev': task_times.std() if task_times.size else 0,
+                'percentile_95': np.percentile(task_times, 95) if task_times.size else 0
             }
         }
         
@@ -254,21 +286,21 @@ class DataAnalyzer:
         recommendations = []
         
         # Analyze breach prevention
-        breach_stats = self.breach_simulator.get_breach_statistics()
+        breach_stats = self.breach_stats
         if breach_stats['prevention_rate'] < 0.90:
             recommendations.append(
                 "Strengthen access control policies to improve breach prevention rate above 90%"
             )
         
         # Analyze device compliance
-        device_stats = self.environment.device_manager.get_compliance_statistics()
+        device_stats = self.device_stats
         if device_stats['compliance_rate'] < 0.85:
             recommendations.append(
                 "Implement automated device remediation to improve compliance rate"
             )
         
         # Analyze usability
-        usability_metrics = self.usability_tester.get_usability_metrics()
+        usability_metrics = self.usability_metrics
         if usability_metrics['average_satisfaction'] < 3.5:
             recommendations.append(
                 "Simplify authentication workflows to improve user satisfaction"
@@ -280,7 +312,7 @@ class DataAnalyzer:
             )
         
         # Analyze authentication
-        auth_stats = self.environment.identity_manager.get_authentication_stats()
+        auth_stats = self.auth_stats
         if auth_stats['success_rate'] < 0.90:
             recommendations.append(
                 "Review authentication methods and provide better user training"
@@ -20,9 +20,12 @@ WORK_LOCATIONS = ['office', 'remote', 'hybrid']
 
 # Security Levels
 SECURITY_LEVELS = ['low', 'medium', 'high', 'critical']
+HIGH_SECURITY_LEVELS = frozenset(('high', 'critical'))
 
 # Authentication Methods
 AUTH_METHODS = ['password', 'mfa', 'biometric', 'certificate']
+# Integer code of each method (its position above), shared by every auth-code column and bitmask
+AUTH_METHOD_CODES = {method: code for code, method in enumerate(AUTH_METHODS)}
 
 # Device Compliance Criteria
 DEVICE_COMPLIANCE = {
@@ -41,6 +44,9 @@ ZTA_THRESHOLDS = {
     'anomaly_threshold': 0.7
 }
 
+# In-memory log retention (monitoring logs evict their oldest entries in small batches beyond this many)
+LOG_RETENTION = 1_000_000
+
 # Breach Simulation Parameters
 BREACH_SCENARIOS = {
     'lateral_movement': {'probability': 0.15, 'severity': 'high'},
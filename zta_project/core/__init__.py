@@ -4,6 +4,6 @@ Core ZTA components package
 from .identity_manager import IdentityManager
 from .device_manager import DeviceManager
 from .access_controller import AccessController
-from .monitoring_system import MonitoringSystem
+from .monitoring_system import MonitoringSystem, Severity
 
-__all__ = ['IdentityManager', 'DeviceManager', 'AccessController', 'MonitoringSystem']
+__all__ = ['IdentityManager', 'DeviceManager', 'AccessController', 'MonitoringSystem', 'Severity']
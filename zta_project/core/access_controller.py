@@ -2,11 +2,14 @@
 Access Control and Policy Enforcement component for ZTA
 """
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 from models.application import Application
 from models.user import User
 from models.device import Device
 
+DENY_NOT_FOUND = 16  # Bulk-check reason bit: user, device or application is not registered
+
 
 class AccessController:
     """Manages access control policies and enforcement"""
@@ -37,7 +40,7 @@ class AccessController:
         """Register an application in the access control system"""
         self.applications[application.app_id] = application
     
-    def request_access(self, session_token: str, device_id: str, app_id: str,
+    def request_access(self, session_token: bytes, device_id: str, app_id: str,
                       action: str = 'read', context: Dict = None) -> Dict:
         """Process an access request using Zero Trust principles"""
         timestamp = datetime.now()
@@ -100,6 +103,44 @@ class AccessController:
         # All checks passed - grant access
         return self._grant_access(user, device, application, action, timestamp)
     
+    def bulk_check(self, triples: Sequence[Tuple[str, str, str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate application access permissions for many (user_id, device_id, app_id)
+        triples at once, grouped into one vectorized check per application.
+        Returns (granted, reason_bits) in input order; reason bits are the
+        Application DENY_* bits plus DENY_NOT_FOUND. Sessions, quarantine and
+        continuous authentication are not evaluated here.
+        """
+        n = len(triples)
+        granted = np.zeros(n, dtype=bool)
+        reason_bits = np.full(n, DENY_NOT_FOUND, dtype=np.uint8)
+        users = self.identity_manager.users
+        devices = self.device_manager.devices
+        
+        # Gather each application's requests as (positions, levels, methods, trust scores, risk scores)
+        groups = {}
+        for i, (user_id, device_id, app_id) in enumerate(triples):
+            user = users.get(user_id)
+            device = devices.get(device_id)
+            if user is None or device is None or app_id not in self.applications:
+                continue
+            group = groups.get(app_id)
+            if group is None:
+                group = groups[app_id] = ([], [], [], [], [])
+            group[0].append(i)
+            group[1].append(user.access_level)
+            group[2].append(user.authentication_method)
+            group[3].append(device.trust_score)
+            group[4].append(user.risk_score)
+        
+        for app_id, (positions, levels, methods, trust_scores, risk_scores) in groups.items():
+            app_granted, app_bits = self.applications[app_id].check_access_permission_bulk(
+                levels, methods, trust_scores, risk_scores)
+            granted[positions] = app_granted
+            reason_bits[positions] = app_bits
+        
+        return granted, reason_bits
+    
     def _grant_access(self, user: User, device: Device, application: Application,
                      action: str, timestamp: datetime) -> Dict:
         """Grant access and log the decision"""
@@ -132,7 +173,7 @@ class AccessController:
             'security_level': application.security_level
         }
     
-    def _deny_access(self, reason: str, session_token: str, device_id: str,
+    def _deny_access(self, reason: str, session_token: bytes, device_id: str,
                     app_id: str, timestamp: datetime, user_id: str = None) -> Dict:
         """Deny access and log the decision"""
         self.denied_access_count += 1
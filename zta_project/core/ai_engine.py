@@ -9,22 +9,25 @@ of simple rule-based approaches for scientific rigor.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from datetime import datetime, timedelta
 from collections import deque, defaultdict
 import random
 import warnings
+from importlib.util import find_spec
+import config
 warnings.filterwarnings('ignore')
 
-try:
-    from sklearn.ensemble import IsolationForest
-    from sklearn.preprocessing import StandardScaler, LabelEncoder
-    from sklearn.model_selection import train_test_split
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
+# scikit-learn takes about a second to import, so it is only located here and imported
+# when a model is first trained
+SKLEARN_AVAILABLE = find_spec('sklearn') is not None
+if not SKLEARN_AVAILABLE:
     print("Warning: scikit-learn not available. Install with: pip install scikit-learn")
 
+# Batches at least this large are scored on a threading backend; smaller ones stay
+# sequential, where dispatching to workers would cost more than the scoring
+PARALLEL_SCORING_MIN_ROWS = 1000
+
 
 class BehavioralAnalyticsModel:
     """
@@ -64,26 +67,26 @@ class BehavioralAnalyticsModel:
             'failed_auth_ratio', 'location_change_count'
         ]
         
-    def _extract_features(self, behavior_history: List[Dict], current_behavior: Optional[Dict] = None) -> np.ndarray:
+    def _extract_features(self, behavior_history: Union[List[Dict], pd.DataFrame],
+                          current_behavior: Optional[Dict] = None) -> np.ndarray:
         """
         Extract ML features from behavior history.
         Uses time-based, frequency-based, and sequence-based features.
+        Accepts a list of behavior dicts or an equivalent DataFrame.
         """
-        if not behavior_history:
+        if len(behavior_history) == 0:
             return np.zeros(len(self.feature_names))
         
-        # Convert to DataFrame for easier processing
-        df = pd.DataFrame(behavior_history)
-        
-        # Ensure timestamp column exists
-        if 'timestamp' not in df.columns:
-            if 'date' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['date'], errors='coerce')
-            else:
-                df['timestamp'] = pd.Timestamp.now()
+        # Convert to DataFrame for easier processing (no copy if already one)
+        df = behavior_history if isinstance(behavior_history, pd.DataFrame) else pd.DataFrame(behavior_history)
         
-        # Extract time-based features
-        timestamps = pd.to_datetime(df['timestamp'], errors='coerce')
+        # Extract time-based features, falling back to the date column or now
+        if 'timestamp' in df.columns:
+            timestamps = pd.to_datetime(df['timestamp'], errors='coerce')
+        elif 'date' in df.columns:
+            timestamps = pd.to_datetime(df['date'], errors='coerce')
+        else:
+            timestamps = pd.Series(pd.Timestamp.now(), index=df.index)
         hours = timestamps.dt.hour.fillna(12)
         days_of_week = timestamps.dt.dayofweek.fillna(0)
         
@@ -158,55 +161,128 @@ class BehavioralAnalyticsModel:
         
         # If current behavior provided, incorporate it
         if current_behavior:
-            current_hour = current_behavior.get('hour', datetime.now().hour)
-            current_day = current_behavior.get('day_of_week', datetime.now().weekday())
-            
-            # Update features with current behavior
-            features[0] = current_hour
-            features[1] = current_day
-            features[2] = np.sin(2 * np.pi * current_hour / 24)
-            features[3] = np.cos(2 * np.pi * current_hour / 24)
-            
-            # Update access rate if provided
-            if 'access_rate' in current_behavior:
-                features[7] = current_behavior['access_rate']
-            
-            # Update location changes
-            if 'location_changes' in current_behavior:
-                features[13] = current_behavior['location_changes']
+            self._apply_current_behavior(features, current_behavior)
         
         return features.reshape(1, -1)
     
-    def train_user_model(self, user_id: str, behavior_history: List[Dict], test_size: float = 0.2):
+    def _apply_current_behavior(self, features: np.ndarray, current_behavior: Dict):
+        """Overwrite the time, access-rate and location-change features of a row in place"""
+        current_hour = current_behavior.get('hour', datetime.now().hour)
+        current_day = current_behavior.get('day_of_week', datetime.now().weekday())
+        
+        # Update features with current behavior
+        features[0] = current_hour
+        features[1] = current_day
+        features[2] = np.sin(2 * np.pi * current_hour / 24)
+        features[3] = np.cos(2 * np.pi * current_hour / 24)
+        
+        # Update access rate if provided
+        if 'access_rate' in current_behavior:
+            features[7] = current_behavior['access_rate']
+        
+        # Update location changes
+        if 'location_changes' in current_behavior:
+            features[13] = current_behavior['location_changes']
+    
+    def _extract_prefix_features(self, history_df: pd.DataFrame) -> np.ndarray:
+        """
+        Extract the features of every prefix of a behavior history in one pass.
+        Row k equals _extract_features(history_df.iloc[:k + 1]), built from running
+        sums and counts instead of re-aggregating each prefix.
+        """
+        n = len(history_df)
+        df = history_df.reset_index(drop=True)
+        lengths = np.arange(1, n + 1, dtype=np.float64)  # Prefix sizes
+        features = np.empty((n, len(self.feature_names)))
+        
+        # Time-based features, with the same fallbacks as _extract_features
+        if 'timestamp' in df.columns:
+            timestamps = pd.to_datetime(df['timestamp'], errors='coerce')
+        elif 'date' in df.columns:
+            timestamps = pd.to_datetime(df['date'], errors='coerce')
+        else:
+            timestamps = pd.Series(pd.Timestamp.now(), index=df.index)
+        hours = timestamps.dt.hour.fillna(12).to_numpy(dtype=np.float64)
+        days_of_week = timestamps.dt.dayofweek.fillna(0).to_numpy(dtype=np.intp)
+        
+        features[:, 0] = np.cumsum(hours) / lengths
+        # Most frequent day so far; argmax keeps the lowest day on ties, like Series.mode()[0]
+        features[:, 1] = np.cumsum(np.eye(7)[days_of_week], axis=0).argmax(axis=1)
+        features[:, 2] = np.cumsum(np.sin(2 * np.pi * hours / 24)) / lengths
+        features[:, 3] = np.cumsum(np.cos(2 * np.pi * hours / 24)) / lengths
+        
+        # Mean frequency of each row's value within the prefix: sum of squared counts / k^2
+        resources = df.get('resource', pd.Series([''] * n))
+        locations = df.get('location', pd.Series([''] * n))
+        devices = df.get('device_id', pd.Series([''] * n))
+        for column, values in ((4, resources), (5, locations), (6, devices)):
+            valid = values.notna()
+            seen_before = values[valid].groupby(values[valid], sort=False).cumcount()
+            squared_count_steps = np.zeros(n)
+            squared_count_steps[valid.to_numpy()] = 2 * seen_before.to_numpy() + 1
+            features[:, column] = np.cumsum(squared_count_steps) / lengths ** 2
+        
+        # Access rate (events per hour over the prefix's time span)
+        span_hours = (timestamps.cummax().ffill() - timestamps.cummin().ffill()).dt.total_seconds() / 3600.0
+        features[:, 7] = np.where(lengths > 1, lengths / np.maximum(span_hours.to_numpy(), 0.1), 0)
+        
+        # Session duration (if available)
+        session_durations = df.get('session_duration', pd.Series([0] * n)).astype(np.float64)
+        features[:, 8] = session_durations.expanding().mean().to_numpy()
+        
+        # Time since last access
+        last_access = timestamps.cummax().ffill()
+        features[:, 9] = (pd.Timestamp.now() - last_access).dt.total_seconds().to_numpy() / 3600.0
+        
+        # Unique resources and locations seen today so far
+        is_today = (timestamps.dt.date == pd.Timestamp.now().date()).to_numpy()
+        for column, values in ((10, resources), (11, locations)):
+            today_values = values.where(is_today)
+            first_seen = today_values.notna().to_numpy() & ~today_values.duplicated().to_numpy()
+            features[:, column] = np.cumsum(first_seen)
+        
+        # Failed authentication ratio
+        failed_auths = df.get('failed_auth', pd.Series([False] * n)).fillna(0).astype(np.float64)
+        features[:, 12] = np.cumsum(failed_auths.to_numpy()) / lengths
+        
+        # Location change count (the first row always counts as a change)
+        location_changes = np.cumsum((locations != locations.shift()).to_numpy())
+        features[:, 13] = np.where(lengths > 1, location_changes, 0)
+        
+        return features
+    
+    def train_user_model(self, user_id: str, behavior_history: Union[List[Dict], pd.DataFrame],
+                         test_size: float = 0.2):
         """
         Train an Isolation Forest model for a specific user.
         Uses proper train/test split to avoid circular logic.
         
         Args:
             user_id: User identifier
-            behavior_history: List of behavior dictionaries
+            behavior_history: List of behavior dictionaries, or a DataFrame with one row per behavior
             test_size: Proportion of data to use for testing (not used in training)
         """
-        if not behavior_history or len(behavior_history) < 10:
+        if len(behavior_history) < 10:
             # Not enough data to train
             return
         
+        from sklearn.ensemble import IsolationForest
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        
+        # Build the frame once; each prefix below is then a cheap row slice
+        history_df = behavior_history if isinstance(behavior_history, pd.DataFrame) else pd.DataFrame(behavior_history)
+        
         # Store full history for pattern analysis
-        self.training_data[user_id] = behavior_history
+        self.training_data[user_id] = history_df
         
-        # Extract features from all behaviors
-        feature_matrix = []
-        for i, behavior in enumerate(behavior_history):
-            # Use history up to this point (no future data leakage)
-            history_up_to_point = behavior_history[:i+1]
-            features = self._extract_features(history_up_to_point)
-            feature_matrix.append(features.flatten())
+        # Extract features from all behaviors, each from the history up to that point
+        # (no future data leakage)
+        X = self._extract_prefix_features(history_df)
         
-        if len(feature_matrix) < 10:
+        if len(X) < 10:
             return
         
-        X = np.array(feature_matrix)
-        
         # Train/test split to avoid circular logic
         if len(X) > 20:
             X_train, X_test = train_test_split(
@@ -228,7 +304,7 @@ class BehavioralAnalyticsModel:
             n_estimators=100,
             max_samples='auto'
         )
-        model.fit(X_train_scaled)
+        model.fit(np.ascontiguousarray(X_train_scaled, dtype=np.float32))  # The forest's working dtype
         self.user_models[user_id] = model
         
         # Store statistical patterns for feature engineering
@@ -245,38 +321,50 @@ class BehavioralAnalyticsModel:
         Predict anomaly score using trained ML model.
         Returns score between 0 (normal) and 1 (highly anomalous).
         """
-        if user_id not in self.user_models:
+        return float(self.predict_anomaly_scores(user_id, [current_behavior])[0])
+    
+    def predict_anomaly_scores(self, user_id: str, behaviors: List[Dict]) -> np.ndarray:
+        """
+        Score a batch of behaviors for one user with a single scaler and forest pass.
+        The history features are extracted once and each behavior overrides its own row.
+        """
+        if user_id not in self.user_models or not self.is_trained.get(user_id, False):
             # New user or insufficient training data
-            return 0.5  # Neutral score for unknown users
-        
-        if not self.is_trained.get(user_id, False):
-            return 0.5
+            return np.full(len(behaviors), 0.5)  # Neutral score for unknown users
         
         # Get user's behavior history (training data)
         behavior_history = self.training_data.get(user_id, [])
         
-        # Extract features including current behavior
-        features = self._extract_features(behavior_history, current_behavior)
+        # Extract features including each current behavior
+        history_features = self._extract_features(behavior_history).ravel()
+        features = np.tile(history_features, (len(behaviors), 1))
+        for row, behavior in zip(features, behaviors):
+            if behavior:
+                self._apply_current_behavior(row, behavior)
         
-        # Scale features
-        scaler = self.scalers[user_id]
-        features_scaled = scaler.transform(features)
+        # Scale features (in float64), then hand the forest float32 as it would cast to anyway
+        features_scaled = np.ascontiguousarray(self.scalers[user_id].transform(features), dtype=np.float32)
         
-        # Predict with Isolation Forest
+        # Score with Isolation Forest; predict() flags an anomaly when the score is below offset_
         model = self.user_models[user_id]
-        prediction = model.predict(features_scaled)[0]  # -1 for anomaly, 1 for normal
-        anomaly_score_raw = model.score_samples(features_scaled)[0]  # Lower = more anomalous
+        if len(features_scaled) >= PARALLEL_SCORING_MIN_ROWS:
+            # Spread the trees over threads; the per-tree scoring runs without the GIL
+            from joblib import parallel_backend
+            with parallel_backend('threading', n_jobs=-1):
+                anomaly_score_raw = model.score_samples(features_scaled)  # Lower = more anomalous
+        else:
+            anomaly_score_raw = model.score_samples(features_scaled)
+        is_anomaly = anomaly_score_raw < model.offset_
         
         # Convert to 0-1 scale (normalize)
         # Isolation Forest scores are negative for anomalies
         # Normalize: score ranges roughly from -0.5 to 0.5
-        normalized_score = 1.0 / (1.0 + np.exp(anomaly_score_raw))  # Sigmoid normalization
+        normalized_scores = 1.0 / (1.0 + np.exp(anomaly_score_raw))  # Sigmoid normalization
         
-        # If prediction is -1 (anomaly), ensure score reflects that
-        if prediction == -1:
-            normalized_score = max(normalized_score, 0.6)  # At least 0.6 if detected as anomaly
+        # If detected as anomaly, ensure score reflects that (at least 0.6)
+        normalized_scores = np.where(is_anomaly, np.maximum(normalized_scores, 0.6), normalized_scores)
         
-        return min(1.0, max(0.0, normalized_score))
+        return np.clip(normalized_scores, 0.0, 1.0)
     
     def get_model_statistics(self, user_id: str) -> Dict:
         """Get statistics about the trained model for a user"""
@@ -347,7 +435,7 @@ class ThreatDetectionModel:
             
         # Access to high-value resources in sequence
         high_value_access = sum(1 for p in access_patterns 
-                               if p.get('security_level') in ['high', 'critical'])
+                               if p.get('security_level') in config.HIGH_SECURITY_LEVELS)
         if high_value_access >= 3:
             return 0.75
             
@@ -449,7 +537,7 @@ class AIAnomalyDetector:
         
         return threat_result
     
-    def train_on_user_behavior(self, user_id: str, behavior_history: List[Dict]):
+    def train_on_user_behavior(self, user_id: str, behavior_history: Union[List[Dict], pd.DataFrame]):
         """Train the behavioral model on user's historical behavior"""
         self.behavioral_model.train_user_model(user_id, behavior_history)
     
@@ -91,7 +91,7 @@ class DeviceManager:
             actions.append('Remove unauthorized software')
         
         # Check patch status
-        days_since_patch = (datetime.now() - device.last_patch_date).days
+        days_since_patch = device.days_since_patch
         if days_since_patch > 30:
             actions.append(f'Apply security patches (last patched {days_since_patch} days ago)')
         
@@ -247,8 +247,8 @@ class DeviceManager:
                 'compliant': device.is_compliant,
                 'posture': device.security_posture,
                 'quarantined': device.device_id in self.quarantined_devices,
-                'incident_count': len(device.security_incidents),
-                'days_since_patch': (datetime.now() - device.last_patch_date).days
+                'incident_count': device.incident_count,
+                'days_since_patch': device.days_since_patch
             })
         
         return report
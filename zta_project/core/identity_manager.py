@@ -2,12 +2,33 @@
 Identity and Access Management (IAM) component for ZTA
 """
 import hashlib
+import heapq
 import secrets
-from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, List, Tuple
+import numpy as np
+import pandas as pd
+import config
 from models.user import User
 from core.ai_engine import AIAnomalyDetector
 
+NS_PER_MINUTE = 60 * 1_000_000_000
+TRAINING_HISTORY_SIZE = 50  # Successful logs per user used to train the behavioral model
+RISK_BUCKET_EDGES = np.array([25, 50, 75])  # low | medium | high | critical
+
+
+@dataclass(slots=True)
+class AuthLog:
+    """Fixed-schema authentication log entry"""
+    timestamp: datetime
+    user_id: str
+    success: bool
+    reason: str
+    context: Dict
+
 
 class IdentityManager:
     """Manages user identities and authentication"""
@@ -15,7 +36,11 @@ class IdentityManager:
     def __init__(self):
         self.users = {}
         self.active_sessions = {}
-        self.authentication_logs = []
+        self._expiry_heap: List[Tuple[int, bytes]] = []  # (expires_at_ns, token) min-heap
+        self.authentication_logs = deque(maxlen=config.LOG_RETENTION)
+        self._success_logs_by_user: Dict[str, deque] = {}  # Recent successful logs per user
+        self._auth_success = 0  # Running counters so stats don't rescan the logs
+        self._auth_failure = 0
         self.session_timeout = 30  # minutes
         self.enable_continuous_auth = True  # Enable continuous authentication by default
         self.ai_detector = AIAnomalyDetector()  # AI-powered anomaly detection
@@ -31,7 +56,7 @@ class IdentityManager:
         timestamp = datetime.now()
         
         if user_id not in self.users:
-            self._log_authentication(user_id, False, 'User not found', context)
+            self._log_authentication(user_id, False, 'User not found', context, timestamp)
             return {
                 'success': False,
                 'reason': 'User not found',
@@ -42,7 +67,7 @@ class IdentityManager:
         
         # Check if user is active
         if not user.is_active:
-            self._log_authentication(user_id, False, 'User account disabled', context)
+            self._log_authentication(user_id, False, 'User account disabled', context, timestamp)
             return {
                 'success': False,
                 'reason': 'User account disabled',
@@ -51,7 +76,7 @@ class IdentityManager:
         
         # Check failed login attempts
         if user.failed_login_attempts >= 3:
-            self._log_authentication(user_id, False, 'Account locked due to failed attempts', context)
+            self._log_authentication(user_id, False, 'Account locked due to failed attempts', context, timestamp)
             return {
                 'success': False,
                 'reason': 'Account locked - too many failed attempts',
@@ -64,7 +89,7 @@ class IdentityManager:
         if auth_success:
             # Create session token
             session_token = self._create_session(user_id, context)
-            self._log_authentication(user_id, True, 'Authentication successful', context)
+            self._log_authentication(user_id, True, 'Authentication successful', context, timestamp)
             
             return {
                 'success': True,
@@ -74,7 +99,7 @@ class IdentityManager:
             }
         else:
             user.update_risk_score('failed_login')
-            self._log_authentication(user_id, False, 'Invalid credentials', context)
+            self._log_authentication(user_id, False, 'Invalid credentials', context, timestamp)
             
             return {
                 'success': False,
@@ -82,22 +107,68 @@ class IdentityManager:
                 'session_token': None
             }
     
-    def _create_session(self, user_id: str, context: Dict = None) -> str:
+    def _create_session(self, user_id: str, context: Dict = None) -> bytes:
         """Create a new session for authenticated user"""
-        session_token = secrets.token_hex(32)
-        expiry = datetime.now() + timedelta(minutes=self.session_timeout)
+        # Raw 16-byte tokens hash faster than 64-char hex strings; use .hex() for display
+        session_token = secrets.token_bytes(16)
+        # Session times are epoch nanoseconds so expiry checks are plain int compares
+        now_ns = time.time_ns()
+        expiry_ns = now_ns + self.session_timeout * NS_PER_MINUTE
+        
+        # Evict abandoned sessions before adding a new one
+        self.sweep_expired(now_ns)
         
         self.active_sessions[session_token] = {
             'user_id': user_id,
-            'created_at': datetime.now(),
-            'expires_at': expiry,
+            'created_at': now_ns,
+            'expires_at': expiry_ns,
             'context': context or {},
-            'last_activity': datetime.now()
+            'last_activity': now_ns
         }
+        heapq.heappush(self._expiry_heap, (expiry_ns, session_token))
         
         return session_token
     
-    def validate_session(self, session_token: str) -> Dict:
+    def sweep_expired(self, now_ns: Optional[int] = None) -> int:
+        """Remove all expired sessions, returning how many were evicted"""
+        if now_ns is None:
+            now_ns = time.time_ns()
+        
+        heap = self._expiry_heap
+        evicted = 0
+        while heap and heap[0][0] < now_ns:
+            expiry_ns, session_token = heapq.heappop(heap)
+            session = self.active_sessions.get(session_token)
+            if session is None:
+                continue  # Already terminated or validated as expired
+            if session['expires_at'] != expiry_ns:
+                # Session was extended; track its newer expiry instead
+                heapq.heappush(heap, (session['expires_at'], session_token))
+                continue
+            del self.active_sessions[session_token]
+            evicted += 1
+        
+        return evicted
+    
+    def _get_valid_session(self, session_token: bytes) -> Optional[Dict]:
+        """Return the live session for a token and refresh its activity, or None"""
+        session = self.active_sessions.get(session_token)
+        if session is None:
+            return None
+        
+        now_ns = time.time_ns()
+        
+        # Check expiry
+        if now_ns > session['expires_at']:
+            del self.active_sessions[session_token]
+            return None
+        
+        # Update last activity
+        session['last_activity'] = now_ns
+        
+        return session
+    
+    def validate_session(self, session_token: bytes) -> Dict:
         """Validate an active session"""
         if session_token not in self.active_sessions:
             return {
@@ -105,43 +176,36 @@ class IdentityManager:
                 'reason': 'Session not found'
             }
         
-        session = self.active_sessions[session_token]
-        
-        # Check expiry
-        if datetime.now() > session['expires_at']:
-            del self.active_sessions[session_token]
+        session = self._get_valid_session(session_token)
+        if session is None:
             return {
                 'valid': False,
                 'reason': 'Session expired'
             }
         
-        # Update last activity
-        session['last_activity'] = datetime.now()
-        
         return {
             'valid': True,
             'user_id': session['user_id'],
             'session_info': session
         }
     
-    def terminate_session(self, session_token: str):
+    def terminate_session(self, session_token: bytes):
         """Terminate a user session"""
         if session_token in self.active_sessions:
             del self.active_sessions[session_token]
     
-    def continuous_authentication(self, session_token: str, behavior_data: Dict) -> bool:
+    def continuous_authentication(self, session_token: bytes, behavior_data: Dict) -> bool:
         """Perform continuous authentication based on user behavior"""
         # If continuous auth is disabled, always return True
         if not self.enable_continuous_auth:
             return True
             
-        session_validation = self.validate_session(session_token)
+        session = self._get_valid_session(session_token)
         
-        if not session_validation['valid']:
+        if session is None:
             return False
         
-        user_id = session_validation['user_id']
-        user = self.users.get(user_id)
+        user = self.users.get(session['user_id'])
         
         if not user:
             return False
@@ -167,44 +231,57 @@ class IdentityManager:
         # Only train model during training phase (not during testing/evaluation)
         # This prevents circular logic where we generate and evaluate with same patterns
         if self.training_phase and user.user_id in self.users and len(self.authentication_logs) > 10:
-            # Extract behavior history from logs
-            user_logs = [log for log in self.authentication_logs 
-                        if log.get('user_id') == user.user_id and log.get('success')]
+            # Extract behavior history from the user's recent successful logs
+            user_logs = self._success_logs_by_user.get(user.user_id, ())
             if len(user_logs) > 5:
-                behavior_history = [{
-                    'timestamp': log['timestamp'] if isinstance(log['timestamp'], datetime) else datetime.now(),
-                    'hour': log['timestamp'].hour if isinstance(log['timestamp'], datetime) else 12,
-                    'day_of_week': log['timestamp'].weekday() if isinstance(log['timestamp'], datetime) else datetime.now().weekday(),
-                    'resource': log.get('context', {}).get('resource', ''),
-                    'location': log.get('context', {}).get('location', ''),
-                    'device_id': log.get('context', {}).get('device_id', ''),
-                    'date': str(log['timestamp'].date()) if isinstance(log['timestamp'], datetime) else str(datetime.now().date()),
-                    'success': log.get('success', True),
-                    'failed_auth': not log.get('success', True)
-                } for log in user_logs[-50:]]  # Use more data for better training
+                behavior_history = self._build_behavior_history(user_logs)
                 self.ai_detector.train_on_user_behavior(user.user_id, behavior_history)
         
         return ai_result['anomaly_score']
     
+    def _build_behavior_history(self, user_logs) -> pd.DataFrame:
+        """Project authentication logs into the behavior frame used for model training"""
+        # Log timestamps are always datetimes (see _log_authentication)
+        timestamps = pd.DatetimeIndex([log.timestamp for log in user_logs])
+        contexts = [log.context for log in user_logs]
+        success = np.fromiter((log.success for log in user_logs), dtype=bool, count=len(user_logs))
+        
+        return pd.DataFrame({
+            'timestamp': timestamps,
+            'hour': timestamps.hour,
+            'day_of_week': timestamps.weekday,
+            'resource': [context.get('resource', '') for context in contexts],
+            'location': [context.get('location', '') for context in contexts],
+            'device_id': [context.get('device_id', '') for context in contexts],
+            'date': timestamps.strftime('%Y-%m-%d'),
+            'success': success,
+            'failed_auth': ~success
+        })
+    
     def set_training_phase(self, training: bool):
         """Set whether we're in training phase (to control when models can be trained)"""
         self.training_phase = training
     
-    def _log_authentication(self, user_id: str, success: bool, reason: str, context: Dict):
+    def _log_authentication(self, user_id: str, success: bool, reason: str, context: Dict,
+                            timestamp: Optional[datetime] = None):
         """Log authentication attempt"""
-        self.authentication_logs.append({
-            'timestamp': datetime.now(),
-            'user_id': user_id,
-            'success': success,
-            'reason': reason,
-            'context': context or {}
-        })
+        entry = AuthLog(timestamp or datetime.now(), user_id, success, reason, context or {})
+        self.authentication_logs.append(entry)
+        
+        if success:
+            self._auth_success += 1
+            user_logs = self._success_logs_by_user.get(user_id)
+            if user_logs is None:
+                user_logs = self._success_logs_by_user[user_id] = deque(maxlen=TRAINING_HISTORY_SIZE)
+            user_logs.append(entry)
+        else:
+            self._auth_failure += 1
     
     def get_authentication_stats(self) -> Dict:
         """Get authentication statistics"""
-        total_attempts = len(self.authentication_logs)
-        successful = sum(1 for log in self.authentication_logs if log['success'])
-        failed = total_attempts - successful
+        successful = self._auth_success
+        failed = self._auth_failure
+        total_attempts = successful + failed
         
         return {
             'total_attempts': total_attempts,
@@ -216,16 +293,14 @@ class IdentityManager:
     
     def get_user_risk_distribution(self) -> Dict:
         """Get distribution of user risk scores"""
-        risk_categories = {'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
-        
-        for user in self.users.values():
-            if user.risk_score < 25:
-                risk_categories['low'] += 1
-            elif user.risk_score < 50:
-                risk_categories['medium'] += 1
-            elif user.risk_score < 75:
-                risk_categories['high'] += 1
-            else:
-                risk_categories['critical'] += 1
-        
-        return risk_categories
+        # Risk scores are mutated directly on User objects, so snapshot them here
+        risk_scores = np.fromiter((user.risk_score for user in self.users.values()),
+                                  dtype=np.float64, count=len(self.users))
+        counts = np.bincount(np.digitize(risk_scores, RISK_BUCKET_EDGES), minlength=4)
+        
+        return {
+            'low': int(counts[0]),
+            'medium': int(counts[1]),
+            'high': int(counts[2]),
+            'critical': int(counts[3])
+        }
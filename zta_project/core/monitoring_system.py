@@ -1,17 +1,48 @@
 """
 Continuous Monitoring and Logging System for ZTA
 """
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Tuple, Union
 import random
+from models._severity import SEVERITY_LEVELS, Severity
+import config
+
+ALERT_THRESHOLD = Severity.HIGH  # Events at or above this level raise an alert
+
+# Logs are cut back to LOG_RETENTION entries once this many extra have accumulated,
+# so the cost of dropping the oldest entries is spread over many appends
+LOG_TRIM_BATCH = max(1, config.LOG_RETENTION // 100)
+
+
+def _describe(event: Dict) -> str:
+    """Return an event's description, formatting a deferred template without changing the event"""
+    args = event.get('description_args')
+    return event['description'] % args if args else event['description']
+
+
+def _append_bounded(log: List[Dict], times: List[datetime], entry: Dict, timestamp: datetime):
+    """Append an entry and its timestamp, trimming both lists in batches past LOG_RETENTION"""
+    log.append(entry)
+    times.append(timestamp)
+    excess = len(log) - config.LOG_RETENTION
+    if excess >= LOG_TRIM_BATCH:
+        del log[:excess]
+        del times[:excess]
 
 
 class MonitoringSystem:
     """Monitors and logs all activities in the ZTA environment"""
     
     def __init__(self):
-        self.security_events = []
-        self.anomalies = []
+        # Lists rather than deques so that bisecting and slicing by index are O(1) per step
+        self.security_events: List[Dict] = []
+        self.anomalies: List[Dict] = []
+        # Parallel timestamp indexes (events arrive in time order), used to bisect
+        # time-window queries instead of scanning every entry
+        self._event_times: List[datetime] = []
+        self._anomaly_times: List[datetime] = []
         self.alerts = []
         self.metrics = {
             'authentication_events': 0,
@@ -20,28 +51,49 @@ class MonitoringSystem:
             'device_posture_checks': 0,
             'security_incidents': 0
         }
+        self.pending_metrics = Counter()  # Counts from the simulation's hot loops, folded in on read
+        
+    def log_event(self, event_type: str, severity: Union[str, Severity], description: str, 
+                  metadata: Dict = None, args: Tuple = ()):
+        """
+        Log a security event. With args, description is a %-style template kept with
+        its args in the stored event; alerts, the incident timeline and export_logs
+        read the formatted text.
+        """
+        if isinstance(severity, Severity):
+            level, severity = severity, severity.name.lower()
+        else:
+            level = SEVERITY_LEVELS.get(severity, Severity.LOW)
         
-    def log_event(self, event_type: str, severity: str, description: str, 
-                  metadata: Dict = None):
-        """Log a security event"""
+        timestamp = datetime.now()
         event = {
-            'timestamp': datetime.now(),
+            'timestamp': timestamp,
             'event_type': event_type,
             'severity': severity,
+            'severity_level': level,
             'description': description,
             'metadata': metadata or {}
         }
+        if args:
+            event['description_args'] = args
         
-        self.security_events.append(event)
+        _append_bounded(self.security_events, self._event_times, event, timestamp)
         
         # Update metrics
         if event_type in self.metrics:
             self.metrics[event_type] += 1
         
-        # Generate alert for high severity events
-        if severity in ['high', 'critical']:
+        # Generate alert for high severity events (a single int compare)
+        if level >= ALERT_THRESHOLD:
             self.generate_alert(event)
     
+    def flush_metrics(self):
+        """Fold the pending metric counts into the running totals"""
+        if self.pending_metrics:
+            for metric, count in self.pending_metrics.items():
+                self.metrics[metric] += count
+            self.pending_metrics.clear()
+    
     def detect_anomaly(self, user_id: str, device_id: str, behavior_data: Dict) -> Dict:
         """Detect anomalous behavior patterns"""
         anomaly_score = 0
@@ -76,22 +128,24 @@ class MonitoringSystem:
         is_anomalous = anomaly_score > 0.5
         
         if is_anomalous:
+            timestamp = datetime.now()
             anomaly = {
-                'timestamp': datetime.now(),
+                'timestamp': timestamp,
                 'user_id': user_id,
                 'device_id': device_id,
                 'anomaly_score': anomaly_score,
                 'indicators': anomaly_indicators,
                 'behavior_data': behavior_data
             }
-            self.anomalies.append(anomaly)
+            _append_bounded(self.anomalies, self._anomaly_times, anomaly, timestamp)
             
             # Log as security event
             self.log_event(
                 'anomaly_detected',
                 'high' if anomaly_score > 0.7 else 'medium',
-                f'Anomalous behavior detected for user {user_id}',
-                {'anomaly_score': anomaly_score, 'indicators': anomaly_indicators}
+                'Anomalous behavior detected for user %s',
+                {'anomaly_score': anomaly_score, 'indicators': anomaly_indicators},
+                args=(user_id,)
             )
         
         return {
@@ -106,8 +160,9 @@ class MonitoringSystem:
             'alert_id': f"ALERT-{len(self.alerts) + 1:05d}",
             'timestamp': event['timestamp'],
             'severity': event['severity'],
+            'severity_level': event['severity_level'],
             'event_type': event['event_type'],
-            'description': event['description'],
+            'description': _describe(event),
             'metadata': event['metadata'],
             'status': 'open',
             'acknowledged': False
@@ -136,13 +191,15 @@ class MonitoringSystem:
     
     def get_security_dashboard(self) -> Dict:
         """Generate security dashboard metrics"""
+        self.flush_metrics()
+        
         # Time-based analysis
         now = datetime.now()
         last_24h = now - timedelta(hours=24)
         last_7d = now - timedelta(days=7)
         
-        events_24h = [e for e in self.security_events if e['timestamp'] > last_24h]
-        anomalies_24h = [a for a in self.anomalies if a['timestamp'] > last_24h]
+        events_24h = self.security_events[bisect_right(self._event_times, last_24h):]
+        anomalies_24h = self.anomalies[bisect_right(self._anomaly_times, last_24h):]
         
         # Severity distribution
         severity_dist = {}
@@ -158,7 +215,7 @@ class MonitoringSystem:
         
         # Open alerts
         open_alerts = [a for a in self.alerts if a['status'] == 'open']
-        critical_alerts = [a for a in open_alerts if a['severity'] == 'critical']
+        critical_alerts = [a for a in open_alerts if a['severity_level'] == Severity.CRITICAL]
         
         return {
             'total_events': len(self.security_events),
@@ -180,24 +237,23 @@ class MonitoringSystem:
         timeline = []
         
         # Add high severity events
-        for event in self.security_events:
-            if event['timestamp'] > cutoff and event['severity'] in ['high', 'critical']:
+        for event in self.security_events[bisect_right(self._event_times, cutoff):]:
+            if event['severity_level'] >= Severity.HIGH:
                 timeline.append({
                     'timestamp': event['timestamp'],
                     'type': 'event',
                     'severity': event['severity'],
-                    'description': event['description']
+                    'description': _describe(event)
                 })
         
         # Add anomalies
-        for anomaly in self.anomalies:
-            if anomaly['timestamp'] > cutoff:
-                timeline.append({
-                    'timestamp': anomaly['timestamp'],
-                    'type': 'anomaly',
-                    'severity': 'high',
-                    'description': f"Anomaly detected: {', '.join(anomaly['indicators'])}"
-                })
+        for anomaly in self.anomalies[bisect_right(self._anomaly_times, cutoff):]:
+            timeline.append({
+                'timestamp': anomaly['timestamp'],
+                'type': 'anomaly',
+                'severity': 'high',
+                'description': f"Anomaly detected: {', '.join(anomaly['indicators'])}"
+            })
         
         # Sort by timestamp
         timeline.sort(key=lambda x: x['timestamp'], reverse=True)
@@ -206,6 +262,7 @@ class MonitoringSystem:
     
     def generate_compliance_report(self) -> Dict:
         """Generate compliance report for audit purposes"""
+        self.flush_metrics()
         return {
             'report_generated': datetime.now(),
             'total_security_events': len(self.security_events),
@@ -231,13 +288,12 @@ class MonitoringSystem:
     
     def export_logs(self, start_date: datetime = None, end_date: datetime = None) -> List[Dict]:
         """Export logs for a specific time period"""
-        logs = []
-        
-        for event in self.security_events:
-            if start_date and event['timestamp'] < start_date:
-                continue
-            if end_date and event['timestamp'] > end_date:
-                continue
-            logs.append(event)
+        lo = bisect_left(self._event_times, start_date) if start_date else 0
+        hi = bisect_right(self._event_times, end_date) if end_date else len(self._event_times)
         
-        return logs
+        exported = []
+        for event in self.security_events[lo:hi]:
+            event = dict(event, description=_describe(event))
+            event.pop('description_args', None)
+            exported.append(event)
+        return exported
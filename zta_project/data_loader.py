@@ -14,6 +14,109 @@ import os
 import json
 from pathlib import Path
 
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Exact result values (lowercased) that mark an authentication as succeeded or failed
+SUCCESS_VALUES = frozenset({'0', '200', 'ok', 'true', '1'})
+FAILURE_VALUES = frozenset({'401', '403'})
+
+# Candidate timestamp columns per dataset format, in priority order
+TIMESTAMP_COLUMNS = {
+    'sentinel': ('TimeGenerated', 'timestamp'),
+    'azure_ad': ('Timestamp', 'TimeGenerated', 'timestamp'),
+    'lanl': ('timestamp', 'date', 'time'),
+    'cert': ('date', 'time', 'timestamp'),
+    'csv': ('timestamp', 'date', 'time', 'datetime')
+}
+DEFAULT_TIMESTAMP_COLUMNS = ('timestamp', 'date')
+
+# Candidate authentication result columns per dataset format, in priority order
+RESULT_COLUMNS = {
+    'sentinel': ('ResultType', 'Result'),
+    'azure_ad': ('Result', 'Status'),
+    'lanl': ('result', 'success'),
+    'cert': ('result', 'success')
+}
+DEFAULT_RESULT_COLUMNS = ('success', 'result')
+
+# Candidate source columns for each standard field, in priority order
+FIELD_COLUMNS = {
+    'user_id': ('user_id', 'UserPrincipalName', 'UserId', 'user', 'username'),
+    'resource': ('resource', 'Application', 'Resource', 'app', 'application'),
+    'location': ('location', 'Location', 'IPAddress', 'ip'),
+    'device_id': ('device_id', 'DeviceId', 'Computer', 'pc', 'device')
+}
+
+
+def _sequence_kernel(user_codes: np.ndarray, ts_ns: np.ndarray, location_codes: np.ndarray,
+                     empty_location: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Access rate and running location-change count over events sorted by (user, time)"""
+    n = len(user_codes)
+    access_rate = np.empty(n, dtype=np.float64)
+    location_changes = np.empty(n, dtype=np.int64)
+    changes = 0
+    
+    for i in range(n):
+        if i == 0 or user_codes[i] != user_codes[i - 1]:
+            # First event of each user
+            access_rate[i] = 1.0
+            changes = 0
+        else:
+            hours = (ts_ns[i] - ts_ns[i - 1]) / 1e9 / 3600.0
+            access_rate[i] = 1.0 / hours if hours > 0 else 10.0  # 10.0: very rapid
+            previous = location_codes[i - 1]
+            if previous >= 0 and previous != empty_location and location_codes[i] != previous:
+                changes += 1
+        location_changes[i] = changes
+    
+    return access_rate, location_changes
+
+
+def _sequence_arrays(user_codes: np.ndarray, ts_ns: np.ndarray, location_codes: np.ndarray,
+                     empty_location: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized equivalent of _sequence_kernel for when Numba is not available"""
+    n = len(user_codes)
+    
+    # Each user's events form one contiguous slice of the sorted arrays
+    starts = np.searchsorted(user_codes, np.arange(user_codes[-1] + 1))
+    first = np.zeros(n, dtype=bool)
+    first[starts] = True
+    
+    hours = np.diff(ts_ns, prepend=ts_ns[0]) / 1e9 / 3600.0
+    with np.errstate(divide='ignore'):
+        access_rate = np.where(hours > 0, 1.0 / hours, 10.0)  # 10.0: very rapid
+    access_rate[first] = 1.0
+    
+    previous = np.roll(location_codes, 1)
+    changed = (~first & (previous >= 0) & (previous != empty_location)
+               & (location_codes != previous))
+    
+    # Running count of changes, restarted at each user's first event
+    running = np.cumsum(changed)
+    location_changes = running - np.repeat(running[starts], np.diff(np.append(starts, n)))
+    
+    return access_rate, location_changes
+
+
+if NUMBA_AVAILABLE:
+    _sequence_kernel = njit(cache=True)(_sequence_kernel)
+
 
 class RealWorldDataLoader:
     """
@@ -36,7 +139,8 @@ class RealWorldDataLoader:
         
     def load_dataset(self, dataset_name: str, format_type: str = 'csv', 
                     train_split: float = 0.7, start_date: Optional[datetime] = None,
-                    end_date: Optional[datetime] = None) -> Tuple[List[Dict], List[Dict]]:
+                    end_date: Optional[datetime] = None,
+                    chunksize: Optional[int] = None, as_frame: bool = False) -> Tuple:
         """
         Load a real-world dataset and split into train/test.
         
@@ -46,20 +150,62 @@ class RealWorldDataLoader:
             train_split: Proportion of data for training (rest for testing)
             start_date: Optional start date filter
             end_date: Optional end date filter
+            chunksize: Optional number of rows per read for large CSV logs
+            as_frame: Return columnar DataFrames instead of lists of dictionaries
             
         Returns:
-            Tuple of (training_data, test_data) as lists of behavior dictionaries
+            Tuple of (training_data, test_data) as lists of behavior dictionaries,
+            or as DataFrames with one column per behavior field if as_frame is set
         """
         file_path = self.data_dir / dataset_name
         
         if not file_path.exists():
             print(f"Warning: Dataset file not found: {file_path}")
             print("Creating synthetic dataset structure for reference...")
-            return self._create_synthetic_structure()
+            train_data, test_data = self._create_synthetic_structure()
+            if as_frame:
+                empty = self._convert_to_standard_format(pd.DataFrame(), format_type)
+                return empty, empty.copy()
+            return train_data, test_data
         
-        # Load based on format
+        if format_type not in self.supported_formats:
+            raise ValueError(f"Unsupported format: {format_type}")
+        
+        # Single fallback time for every missing timestamp in this load
+        now = datetime.now().astimezone()
+        
+        if chunksize and file_path.suffix != '.json':
+            # Stream large logs, keeping only the standard columns of each chunk
+            behaviors = self._build_behaviors(
+                self._load_in_chunks(file_path, format_type, chunksize, now))
+        else:
+            df = self._load_format(file_path, format_type)
+            
+            # Convert to standard format
+            behaviors = self._convert_to_standard_format(df, format_type, now)
+        
+        # Filter by date if provided
+        if start_date or end_date:
+            behaviors = self._filter_by_date(behaviors, start_date, end_date)
+        
+        # Split into train/test (temporal split to avoid data leakage)
+        train_data, test_data = self._temporal_split(behaviors, train_split)
+        
+        if as_frame:
+            return train_data, test_data
+        return self.to_dicts(train_data), self.to_dicts(test_data)
+    
+    def to_dicts(self, behaviors: pd.DataFrame) -> List[Dict]:
+        """Convert a behavior frame to the list-of-dictionaries form"""
+        behaviors = behaviors.assign(date=behaviors['date'].dt.date)
+        columns = behaviors.columns.tolist()
+        # Plain tuples (already Python scalars) avoid to_dict's per-value boxing pass
+        return [dict(zip(columns, row)) for row in behaviors.itertuples(index=False, name=None)]
+    
+    def _load_format(self, file_path: Path, format_type: str) -> pd.DataFrame:
+        """Load a whole dataset file based on its format"""
         if format_type == 'csv':
-            df = pd.read_csv(file_path)
+            df = self._read_csv_fast(file_path)
         elif format_type == 'sentinel':
             df = self._load_sentinel_format(file_path)
         elif format_type == 'azure_ad':
@@ -71,27 +217,49 @@ class RealWorldDataLoader:
         else:
             raise ValueError(f"Unsupported format: {format_type}")
         
-        # Convert to standard format
-        behaviors = self._convert_to_standard_format(df, format_type)
+        return df
+    
+    def _load_in_chunks(self, file_path: Path, format_type: str, chunksize: int,
+                        now: Optional[datetime] = None) -> pd.DataFrame:
+        """Read a large CSV chunk by chunk so only one raw chunk is held in memory"""
+        # The format-specific CSV loaders read with default options, so chunks match them
+        reader = pd.read_csv(file_path, chunksize=chunksize, engine='c', low_memory=False)
+        chunks = []
+        field_columns = None
+        for chunk in reader:
+            if field_columns is None:
+                # Every chunk has the same header, so resolve source columns once
+                field_columns = self._resolve_field_columns(chunk.columns)
+            chunks.append(self._extract_standard_columns(chunk, format_type, field_columns, now))
         
-        # Filter by date if provided
-        if start_date or end_date:
-            behaviors = self._filter_by_date(behaviors, start_date, end_date)
+        if not chunks:
+            return self._extract_standard_columns(pd.DataFrame(), format_type)
         
-        # Split into train/test (temporal split to avoid data leakage)
-        train_data, test_data = self._temporal_split(behaviors, train_split)
+        return pd.concat(chunks, ignore_index=True)
+    
+    def _read_csv_fast(self, file_path: Path, **kwargs) -> pd.DataFrame:
+        """Read a CSV with the multithreaded PyArrow parser, falling back to the C parser"""
+        if PYARROW_AVAILABLE:
+            try:
+                return pd.read_csv(file_path, engine='pyarrow', **kwargs)
+            except ValueError:
+                pass  # Option or input the PyArrow parser does not support
         
-        return train_data, test_data
+        return pd.read_csv(file_path, engine='c', low_memory=False, **kwargs)
     
     def _load_sentinel_format(self, file_path: Path) -> pd.DataFrame:
         """Load Microsoft Sentinel log format"""
         # Sentinel logs are typically JSON or CSV
         if file_path.suffix == '.json':
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                # orjson parses straight from bytes in C, several times faster than json
+                data = orjson.loads(file_path.read_bytes())
+            else:
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
             df = pd.json_normalize(data)
         else:
-            df = pd.read_csv(file_path)
+            df = self._read_csv_fast(file_path)
         
         # Map Sentinel fields to standard format
         # Expected fields: TimeGenerated, UserPrincipalName, IPAddress, ResultType, etc.
@@ -99,26 +267,27 @@ class RealWorldDataLoader:
     
     def _load_azure_ad_format(self, file_path: Path) -> pd.DataFrame:
         """Load Azure AD Identity Protection logs"""
-        df = pd.read_csv(file_path)
+        df = self._read_csv_fast(file_path)
         # Expected fields: Timestamp, UserId, IPAddress, Result, Location, etc.
         return df
     
     def _load_lanl_format(self, file_path: Path) -> pd.DataFrame:
         """Load LANL authentication dataset format"""
         # LANL format: timestamp, user, computer, authentication type, logon type, etc.
-        df = pd.read_csv(file_path, sep=',')
+        df = self._read_csv_fast(file_path, sep=',')
         return df
     
     def _load_cert_format(self, file_path: Path) -> pd.DataFrame:
         """Load CERT Insider Threat dataset format"""
         # CERT format: user, date, time, pc, activity, etc.
-        df = pd.read_csv(file_path)
+        df = self._read_csv_fast(file_path)
         return df
     
-    def _convert_to_standard_format(self, df: pd.DataFrame, format_type: str) -> List[Dict]:
+    def _convert_to_standard_format(self, df: pd.DataFrame, format_type: str,
+                                    now: Optional[datetime] = None) -> pd.DataFrame:
         """
-        Convert dataset-specific format to standard behavior dictionary format.
-        Standard format: {
+        Convert dataset-specific format to a standard behavior frame.
+        Standard columns (one row per behavior): {
             'timestamp': datetime,
             'user_id': str,
             'resource': str,
@@ -131,184 +300,204 @@ class RealWorldDataLoader:
             ...
         }
         """
-        behaviors = []
+        return self._build_behaviors(self._extract_standard_columns(df, format_type, now=now))
+    
+    def _resolve_field_columns(self, columns: pd.Index) -> Dict[str, List[str]]:
+        """Find which candidate source columns are present for each standard field"""
+        present = set(columns)
+        return {field: [key for key in candidates if key in present]
+                for field, candidates in FIELD_COLUMNS.items()}
+    
+    def _extract_standard_columns(self, df: pd.DataFrame, format_type: str,
+                                  field_columns: Optional[Dict[str, List[str]]] = None,
+                                  now: Optional[datetime] = None) -> pd.DataFrame:
+        """Extract the standard behavior columns from a dataset-specific frame"""
+        if field_columns is None:
+            field_columns = self._resolve_field_columns(df.columns)
         
-        for _, row in df.iterrows():
-            behavior = {}
-            
-            # Extract timestamp
-            timestamp = self._extract_timestamp(row, format_type)
-            behavior['timestamp'] = timestamp
-            behavior['date'] = timestamp.date() if timestamp else datetime.now().date()
-            behavior['hour'] = timestamp.hour if timestamp else datetime.now().hour
-            behavior['day_of_week'] = timestamp.weekday() if timestamp else datetime.now().weekday()
-            
-            # Extract user ID
-            behavior['user_id'] = self._extract_field(row, format_type, 'user_id', 
-                                                       ['UserPrincipalName', 'UserId', 'user', 'username'])
-            
-            # Extract resource/application
-            behavior['resource'] = self._extract_field(row, format_type, 'resource',
-                                                       ['Application', 'Resource', 'app', 'application'])
-            
-            # Extract location/IP
-            behavior['location'] = self._extract_field(row, format_type, 'location',
-                                                       ['Location', 'IPAddress', 'ip', 'location'])
-            
-            # Extract device
-            behavior['device_id'] = self._extract_field(row, format_type, 'device_id',
-                                                       ['DeviceId', 'Computer', 'pc', 'device'])
-            
-            # Extract authentication result
-            success = self._extract_success(row, format_type)
-            behavior['success'] = success
-            behavior['failed_auth'] = not success
-            
-            # Additional fields
-            behavior['access_rate'] = 1.0  # Will be calculated from sequence
-            behavior['location_changes'] = 0  # Will be calculated from sequence
-            
-            behaviors.append(behavior)
+        return pd.DataFrame({
+            'timestamp': self._extract_timestamps(df, format_type, now),
+            'user_id': self._extract_column(df, 'user_id', field_columns['user_id']),
+            'resource': self._extract_column(df, 'resource', field_columns['resource']),
+            'location': self._extract_column(df, 'location', field_columns['location']),
+            'device_id': self._extract_column(df, 'device_id', field_columns['device_id']),
+            'success': self._extract_success(df, format_type)
+        }, index=df.index).reset_index(drop=True)
+    
+    def _build_behaviors(self, columns: pd.DataFrame) -> pd.DataFrame:
+        """Build the standard behavior frame from the extracted columns"""
+        # Repetitive string fields become categoricals: int codes plus one copy of each value,
+        # so grouping and comparisons work on integers
+        columns = columns.astype({field: 'category' for field in FIELD_COLUMNS})
+        timestamps = columns['timestamp']
         
         # Calculate derived features (access rate, location changes) from sequence
-        behaviors = self._calculate_sequence_features(behaviors)
+        access_rate, location_changes = self._calculate_sequence_features(columns)
+        
+        # Every column is built once at its final dtype; no placeholders are overwritten.
+        # Calendar fields come from the .dt accessors in one pass each; hour and weekday
+        # fit in int8, and dates stay datetime64 (midnight) rather than date objects
+        behaviors = pd.DataFrame({
+            'timestamp': timestamps,
+            'date': timestamps.dt.normalize(),
+            'hour': timestamps.dt.hour.astype(np.int8),
+            'day_of_week': timestamps.dt.weekday.astype(np.int8),
+            'user_id': columns['user_id'],
+            'resource': columns['resource'],
+            'location': columns['location'],
+            'device_id': columns['device_id'],
+            'success': columns['success'],
+            'failed_auth': ~columns['success'],
+            'access_rate': access_rate,
+            'location_changes': location_changes
+        })
         
         return behaviors
     
-    def _extract_timestamp(self, row: pd.Series, format_type: str) -> Optional[datetime]:
-        """Extract timestamp from row based on format"""
-        timestamp_fields = {
-            'sentinel': ['TimeGenerated', 'timestamp'],
-            'azure_ad': ['Timestamp', 'TimeGenerated', 'timestamp'],
-            'lanl': ['timestamp', 'date', 'time'],
-            'cert': ['date', 'time', 'timestamp'],
-            'csv': ['timestamp', 'date', 'time', 'datetime']
-        }
-        
-        fields = timestamp_fields.get(format_type, ['timestamp', 'date'])
+    def _extract_timestamps(self, df: pd.DataFrame, format_type: str,
+                            now: Optional[datetime] = None) -> pd.Series:
+        """Extract timestamps for every row, taking the first parseable candidate column"""
+        timestamps = None
+        fields = TIMESTAMP_COLUMNS.get(format_type, DEFAULT_TIMESTAMP_COLUMNS)
         for field in fields:
-            if field in row and pd.notna(row[field]):
-                try:
-                    return pd.to_datetime(row[field])
-                except:
-                    continue
+            if field in df.columns:
+                parsed = self._parse_timestamp_column(df[field])
+                timestamps = parsed if timestamps is None else timestamps.fillna(parsed)
+        
+        if timestamps is None:
+            timestamps = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+        
+        # Missing timestamps fall back to the load time, as local time for naive columns
+        fallback = pd.Timestamp(now or datetime.now().astimezone())
+        tz = timestamps.dt.tz
+        fallback = fallback.tz_convert(tz) if tz is not None else fallback.tz_localize(None)
         
-        return datetime.now()
+        return timestamps.fillna(fallback)
     
-    def _extract_field(self, row: pd.Series, format_type: str, default_key: str, 
-                      possible_keys: List[str]) -> str:
-        """Extract a field from row, trying multiple possible column names"""
-        # Try default key first
-        if default_key in row and pd.notna(row[default_key]):
-            return str(row[default_key])
-        
-        # Try possible keys
-        for key in possible_keys:
-            if key in row and pd.notna(row[key]):
-                return str(row[key])
-        
-        return f"unknown_{default_key}"
+    def _parse_timestamp_column(self, values: pd.Series) -> pd.Series:
+        """Parse a whole timestamp column in one call"""
+        # Format is inferred once for the column; repeated values hit the parse cache
+        parsed = pd.to_datetime(values, errors='coerce', cache=True)
+        
+        # Values that did not match the inferred format are re-parsed individually
+        retry = parsed.isna() & values.notna()
+        if retry.any():
+            try:
+                parsed[retry] = pd.to_datetime(values[retry], errors='coerce', format='mixed')
+            except (TypeError, ValueError):
+                pass  # e.g. naive values in a tz-aware column; left unparsed
+        
+        return parsed
     
-    def _extract_success(self, row: pd.Series, format_type: str) -> bool:
-        """Extract authentication success from row"""
-        success_fields = {
-            'sentinel': ['ResultType', 'Result'],
-            'azure_ad': ['Result', 'Status'],
-            'lanl': ['result', 'success'],
-            'cert': ['result', 'success']
-        }
+    def _extract_column(self, df: pd.DataFrame, default_key: str, columns: List[str]) -> pd.Series:
+        """Extract a field for every row, taking the first non-null of its resolved columns"""
+        values = None
+        for key in columns:
+            values = df[key] if values is None else values.where(values.notna(), df[key])
         
-        fields = success_fields.get(format_type, ['success', 'result'])
-        for field in fields:
-            if field in row:
-                value = str(row[field]).lower()
-                if 'success' in value or value in ['0', '200', 'ok', 'true', '1']:
-                    return True
-                if 'fail' in value or 'denied' in value or value in ['401', '403']:
-                    return False
+        if values is None:
+            return pd.Series(f"unknown_{default_key}", index=df.index)
         
-        # Default to success if unclear
-        return True
+        return values.fillna(f"unknown_{default_key}").astype(str)
     
-    def _calculate_sequence_features(self, behaviors: List[Dict]) -> List[Dict]:
-        """Calculate sequence-based features like access rate and location changes"""
-        if not behaviors:
-            return behaviors
-        
-        # Group by user
-        user_behaviors = {}
-        for behavior in behaviors:
-            user_id = behavior.get('user_id', 'unknown')
-            if user_id not in user_behaviors:
-                user_behaviors[user_id] = []
-            user_behaviors[user_id].append(behavior)
-        
-        # Calculate features per user
-        for user_id, user_behavs in user_behaviors.items():
-            # Sort by timestamp
-            user_behavs.sort(key=lambda x: x.get('timestamp', datetime.now()))
-            
-            # Calculate access rate (events per hour)
-            for i, behavior in enumerate(user_behavs):
-                if i > 0:
-                    prev_time = user_behavs[i-1].get('timestamp', datetime.now())
-                    curr_time = behavior.get('timestamp', datetime.now())
-                    time_diff = (curr_time - prev_time).total_seconds() / 3600.0
-                    if time_diff > 0:
-                        behavior['access_rate'] = 1.0 / time_diff
-                    else:
-                        behavior['access_rate'] = 10.0  # Very rapid
-                else:
-                    behavior['access_rate'] = 1.0
+    def _extract_success(self, df: pd.DataFrame, format_type: str) -> np.ndarray:
+        """Extract authentication success for every row"""
+        # Default to success if unclear
+        success = np.ones(len(df), dtype=bool)
+        undecided = np.ones(len(df), dtype=bool)
+        
+        fields = RESULT_COLUMNS.get(format_type, DEFAULT_RESULT_COLUMNS)
+        for field in fields:
+            if field not in df.columns:
+                continue
+            # Result codes are a small alphabet, so classify each distinct value once
+            codes, uniques = pd.factorize(df[field].astype(str), use_na_sentinel=False)
+            values = pd.Series(uniques).str.lower()
+            is_success = (values.str.contains('success', regex=False, na=False)
+                          | values.isin(SUCCESS_VALUES)).to_numpy()[codes]
+            is_failure = (values.str.contains('fail', regex=False, na=False)
+                          | values.str.contains('denied', regex=False, na=False)
+                          | values.isin(FAILURE_VALUES)).to_numpy()[codes]
             
-            # Calculate location changes
-            prev_location = None
-            location_changes = 0
-            for behavior in user_behavs:
-                curr_location = behavior.get('location', '')
-                if prev_location and curr_location != prev_location:
-                    location_changes += 1
-                behavior['location_changes'] = location_changes
-                prev_location = curr_location
+            decided = undecided & (is_success | is_failure)
+            success[decided] = is_success[decided]
+            undecided &= ~decided
         
-        return behaviors
+        return success
+    
+    def _calculate_sequence_features(self, behaviors: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate sequence-based features like access rate and location changes, in row order"""
+        if behaviors.empty:
+            return np.ones(0), np.zeros(0, dtype=np.int64)
+        
+        user_codes, _ = pd.factorize(behaviors['user_id'])
+        location_codes, locations = pd.factorize(behaviors['location'])
+        empty_location = locations.get_loc('') if '' in locations else -1
+        ts_ns = pd.DatetimeIndex(behaviors['timestamp']).as_unit('ns').asi8
+        
+        # Order each user's events by time in one stable sort (ties keep their original order)
+        order = np.lexsort((ts_ns, user_codes))
+        sequence_features = _sequence_kernel if NUMBA_AVAILABLE else _sequence_arrays
+        sorted_rate, sorted_changes = sequence_features(
+            user_codes[order], ts_ns[order], location_codes[order], empty_location)
+        
+        # Scatter back to row order
+        access_rate = np.empty_like(sorted_rate)
+        access_rate[order] = sorted_rate
+        location_changes = np.empty_like(sorted_changes)
+        location_changes[order] = sorted_changes
+        
+        return access_rate, location_changes
     
-    def _filter_by_date(self, behaviors: List[Dict], start_date: Optional[datetime],
-                       end_date: Optional[datetime]) -> List[Dict]:
+    def _filter_by_date(self, behaviors: pd.DataFrame, start_date: Optional[datetime],
+                       end_date: Optional[datetime]) -> pd.DataFrame:
         """Filter behaviors by date range"""
-        filtered = []
-        for behavior in behaviors:
-            timestamp = behavior.get('timestamp')
-            if not timestamp:
-                continue
-            
-            if start_date and timestamp < start_date:
-                continue
-            if end_date and timestamp > end_date:
-                continue
-            
-            filtered.append(behavior)
+        timestamps = behaviors['timestamp']
         
-        return filtered
+        # One boolean mask over the whole column; bounds are converted once
+        mask = np.ones(len(behaviors), dtype=bool)
+        if start_date:
+            mask &= (timestamps >= self._date_bound(start_date, timestamps.dt.tz)).to_numpy()
+        if end_date:
+            mask &= (timestamps <= self._date_bound(end_date, timestamps.dt.tz)).to_numpy()
+        
+        return behaviors[mask]
+    
+    def _date_bound(self, value: datetime, tz) -> pd.Timestamp:
+        """Convert a filter bound to a Timestamp comparable with the timestamp column"""
+        bound = pd.Timestamp(value)
+        if tz is not None and bound.tzinfo is None:
+            bound = bound.tz_localize(tz)  # Naive bounds are read in the logs' timezone
+        return bound
     
-    def _temporal_split(self, behaviors: List[Dict], train_split: float) -> Tuple[List[Dict], List[Dict]]:
+    def _temporal_split(self, behaviors: pd.DataFrame,
+                        train_split: float) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Split behaviors temporally (by time, not randomly) to avoid data leakage.
-        Earlier data for training, later data for testing.
+        Earlier data for training, later data for testing. Each side is sorted by
+        timestamp, ties kept in input order.
         """
-        if not behaviors:
-            return [], []
-        
-        # Sort by timestamp
-        sorted_behaviors = sorted(behaviors, key=lambda x: x.get('timestamp', datetime.min))
-        
         # Split point
-        split_idx = int(len(sorted_behaviors) * train_split)
+        split_idx = int(len(behaviors) * train_split)
+        timestamps = pd.DatetimeIndex(behaviors['timestamp']).asi8
+        if split_idx >= len(behaviors):
+            return behaviors.iloc[np.argsort(timestamps, kind='stable')], behaviors.iloc[:0]
+        
+        # Only the split_idx-th earliest timestamp decides the sides, so partition (O(n))
+        cutoff = np.partition(timestamps, split_idx)[split_idx]
+        in_train = timestamps < cutoff
         
-        train_data = sorted_behaviors[:split_idx]
-        test_data = sorted_behaviors[split_idx:]
+        # Events at the cutoff fill the remaining training slots in input order,
+        # matching a stable sort
+        ties = np.flatnonzero(timestamps == cutoff)
+        in_train[ties[:split_idx - np.count_nonzero(in_train)]] = True
         
-        return train_data, test_data
+        # Then each side is put in time order on its own
+        train_rows = np.flatnonzero(in_train)
+        test_rows = np.flatnonzero(~in_train)
+        train_rows = train_rows[np.argsort(timestamps[train_rows], kind='stable')]
+        test_rows = test_rows[np.argsort(timestamps[test_rows], kind='stable')]
+        return behaviors.iloc[train_rows], behaviors.iloc[test_rows]
     
     def _create_synthetic_structure(self) -> Tuple[List[Dict], List[Dict]]:
         """Create a placeholder structure when real data is not available"""
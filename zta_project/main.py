@@ -25,27 +25,31 @@ from reporting import ReportGenerator
 import config
 
 
+# Project banner, printed in one write
+HEADER_BANNER = "\n".join([
+    "\n" + "=" * 80,
+    "ZERO TRUST ARCHITECTURE RESEARCH PROJECT",
+    "Effectiveness in Securing Hybrid Work Environments",
+    "=" * 80,
+    "This research evaluates ZTA implementation through:",
+    "  - Identity Verification & Access Management",
+    "  - Device Posture Assessment & Compliance",
+    "  - Micro-segmentation & Policy Enforcement",
+    "  - Continuous Monitoring & Threat Detection",
+    "  - Security Breach Simulation & Prevention",
+    "  - Usability Testing & User Experience Evaluation",
+    "=" * 80 + "\n"
+])
+
+
 def print_header():
     """Print project header"""
-    print("\n" + "="*80)
-    print("ZERO TRUST ARCHITECTURE RESEARCH PROJECT")
-    print("Effectiveness in Securing Hybrid Work Environments")
-    print("="*80)
-    print("This research evaluates ZTA implementation through:")
-    print("  - Identity Verification & Access Management")
-    print("  - Device Posture Assessment & Compliance")
-    print("  - Micro-segmentation & Policy Enforcement")
-    print("  - Continuous Monitoring & Threat Detection")
-    print("  - Security Breach Simulation & Prevention")
-    print("  - Usability Testing & User Experience Evaluation")
-    print("="*80 + "\n")
+    print(HEADER_BANNER)
 
 
 def print_section(title):
     """Print section header"""
-    print(f"\n{'='*80}")
-    print(f"{title.center(80)}")
-    print(f"{'='*80}\n")
+    print(f"\n{'='*80}\n{title.center(80)}\n{'='*80}\n")
 
 
 def print_success(message):
@@ -173,15 +177,15 @@ def main():
         visualizer.plot_comparative_analysis(comparison_results)
         
         print_info("  Creating breach analysis visualization...")
-        breach_stats = breach_simulator.get_breach_statistics()
+        breach_stats = analyzer.breach_stats
         visualizer.plot_breach_analysis(breach_stats)
         
         print_info("  Creating device trust distribution visualization...")
-        device_stats = environment.device_manager.get_compliance_statistics()
+        device_stats = analyzer.device_stats
         visualizer.plot_device_trust_distribution(device_stats)
         
         print_info("  Creating authentication analysis visualization...")
-        auth_stats = environment.identity_manager.get_authentication_stats()
+        auth_stats = analyzer.auth_stats
         visualizer.plot_authentication_analysis(auth_stats)
         
         print_info("  Creating executive dashboard...")
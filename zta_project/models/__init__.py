@@ -1,8 +1,11 @@
 """
 Models package for ZTA simulation
 """
-from .user import User
-from .device import Device
+from .user import User, UserRegistry
+from .device import Device, DeviceRegistry
 from .application import Application
+from ._clock import SimClock, sim_clock
+from ._severity import Severity
 
-__all__ = ['User', 'Device', 'Application']
+__all__ = ['User', 'UserRegistry', 'Device', 'DeviceRegistry', 'Application', 'SimClock', 'sim_clock',
+           'Severity']
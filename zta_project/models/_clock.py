@@ -0,0 +1,37 @@
+"""
+Shared clock for model timestamps
+"""
+import time
+from datetime import datetime
+from typing import Optional
+
+US_PER_DAY = 86_400 * 1_000_000
+
+
+class SimClock:
+    """Wall clock that can be frozen per simulation step so models share one timestamp"""
+    
+    def __init__(self):
+        self._now: Optional[datetime] = None
+        self._now_us = 0
+    
+    def tick(self) -> datetime:
+        """Advance to the current wall-clock time and hold it until the next tick"""
+        self._now = datetime.now()
+        self._now_us = round(self._now.timestamp() * 1_000_000)
+        return self._now
+    
+    def release(self):
+        """Stop holding a ticked time; now() reads the wall clock again"""
+        self._now = None
+    
+    def now(self) -> datetime:
+        """Current simulation time (the last tick, or the wall clock when not ticking)"""
+        return self._now if self._now is not None else datetime.now()
+    
+    def now_epoch_us(self) -> int:
+        """Current simulation time as integer epoch microseconds"""
+        return self._now_us if self._now is not None else time.time_ns() // 1000
+
+
+sim_clock = SimClock()
@@ -0,0 +1,43 @@
+"""
+Compiled kernels for bulk device operations (used when Numba is installed)
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def posture_step(checks_bits: np.ndarray, trust_score: np.ndarray, is_compliant: np.ndarray,
+                 posture_code: np.ndarray, indices: np.ndarray, flip_bits: np.ndarray,
+                 raises: np.ndarray, drops: np.ndarray, unauthorized_bit: int,
+                 num_checks: int, posture_by_good: np.ndarray):
+    """One posture check over the given registry slots, using the caller's random draws"""
+    for k in range(len(indices)):
+        i = indices[k]
+        x = checks_bits[i] ^ flip_bits[k]
+        checks_bits[i] = x
+        
+        # Popcount of passing checks (unauthorized software passes when its bit is clear)
+        g = x ^ unauthorized_bit
+        g = g - ((g >> 1) & 0x55)
+        g = (g & 0x33) + ((g >> 2) & 0x33)
+        good = (g + (g >> 4)) & 0x0F
+        
+        # 70% threshold for compliance
+        compliant = 10 * good >= 7 * num_checks
+        is_compliant[i] = compliant
+        posture_code[i] = posture_by_good[good]
+        
+        trust = np.int64(trust_score[i])
+        if compliant:
+            trust = min(100, trust + raises[k])
+        else:
+            trust = max(0, trust - drops[k])
+        trust_score[i] = trust
+
+
+if NUMBA_AVAILABLE:
+    posture_step = njit(cache=True)(posture_step)
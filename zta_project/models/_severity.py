@@ -0,0 +1,16 @@
+"""
+Shared severity scale for security events and device incidents
+"""
+from enum import IntEnum
+
+
+class Severity(IntEnum):
+    """Ordered security event severity levels"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+# Severity names as used in event/alert records, mapped to their ordered level
+SEVERITY_LEVELS = {severity.name.lower(): severity for severity in Severity}
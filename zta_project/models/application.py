@@ -2,116 +2,185 @@
 Application model for ZTA simulation
 """
 import random
-from typing import Dict, List
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+import config
+
+# Denial reason bits returned by bulk permission checks
+DENY_ACCESS_LEVEL = 1
+DENY_AUTH_METHOD = 2
+DENY_DEVICE_TRUST = 4
+DENY_USER_RISK = 8
+
+# Policy tables by security level; auth-method tuples are shared between applications
+REQUIRED_ACCESS_LEVELS = {
+    'low': 1,
+    'medium': 2,
+    'high': 3,
+    'critical': 4
+}
+REQUIRED_AUTH_METHODS = {
+    'critical': ('mfa', 'biometric', 'certificate'),
+    'high': ('mfa', 'biometric'),
+    'medium': ('mfa', 'password')
+}
+DEFAULT_REQUIRED_AUTH_METHODS = ('password',)
+DATA_CLASSIFICATIONS = {
+    'critical': 'confidential',
+    'high': 'restricted',
+    'medium': 'internal',
+    'low': 'public'
+}
+
+# Access logs are fixed-size rings of the most recent attempts per application
+ACCESS_LOG_CAPACITY = 10_000
+# User and device ids are held by reference, so an id is released once its entries wrap out
+ACCESS_LOG_DTYPE = np.dtype([('ts', 'i8'), ('uid', 'O'), ('did', 'O'), ('granted', '?')])
 
 
 class Application:
     """Represents an application resource in the organization"""
     
+    __slots__ = ('app_id', 'name', 'security_level', 'app_type', 'required_access_level',
+                 'required_auth_methods', 'network_segment', '_log_ring', '_log_count',
+                 'is_cloud_based', 'supports_mfa', 'data_classification')
+    
+    # get_application_info columns, each read from the attribute of the same name
+    INFO_COLUMNS = ('app_id', 'name', 'security_level', 'app_type', 'required_access_level',
+                    'network_segment', 'is_cloud_based', 'data_classification', 'total_access_attempts')
+    INFO_VALUES = attrgetter(*INFO_COLUMNS)
+    
     def __init__(self, app_id: str, name: str, security_level: str, app_type: str):
         self.app_id = app_id
         self.name = name
         self.security_level = security_level
         self.app_type = app_type
-        self.required_access_level = self._determine_required_access()
-        self.required_auth_methods = self._determine_required_auth()
-        self.network_segment = self._assign_network_segment()
-        self.access_logs = []
+        self.required_access_level = REQUIRED_ACCESS_LEVELS.get(security_level, 1)
+        self.required_auth_methods = REQUIRED_AUTH_METHODS.get(security_level, DEFAULT_REQUIRED_AUTH_METHODS)
+        # Micro-segmentation: high-security apps go to the secure segments
+        if security_level in config.HIGH_SECURITY_LEVELS:
+            self.network_segment = f'secure_segment_{random.randint(1, 3)}'
+        else:
+            self.network_segment = f'general_segment_{random.randint(1, 5)}'
+        self._log_ring = np.zeros(16, dtype=ACCESS_LOG_DTYPE)  # Grows up to ACCESS_LOG_CAPACITY, then wraps
+        self._log_count = 0
         self.is_cloud_based = random.choice([True, False])
         self.supports_mfa = True
-        self.data_classification = self._determine_data_classification()
+        self.data_classification = DATA_CLASSIFICATIONS.get(security_level, 'internal')
         
-    def _determine_required_access(self) -> int:
-        """Determine minimum access level required"""
-        level_mapping = {
-            'low': 1,
-            'medium': 2,
-            'high': 3,
-            'critical': 4
-        }
-        return level_mapping.get(self.security_level, 1)
-    
-    def _determine_required_auth(self) -> List[str]:
-        """Determine required authentication methods"""
-        if self.security_level == 'critical':
-            return ['mfa', 'biometric', 'certificate']
-        elif self.security_level == 'high':
-            return ['mfa', 'biometric']
-        elif self.security_level == 'medium':
-            return ['mfa', 'password']
-        else:
-            return ['password']
-    
-    def _assign_network_segment(self) -> str:
-        """Assign application to network segment (micro-segmentation)"""
-        if self.security_level in ['critical', 'high']:
-            return f'secure_segment_{random.randint(1, 3)}'
-        else:
-            return f'general_segment_{random.randint(1, 5)}'
+    @property
+    def _min_trust(self) -> int:
+        """Minimum device trust score for the current security level"""
+        return 70 if self.security_level in config.HIGH_SECURITY_LEVELS else 50
     
-    def _determine_data_classification(self) -> str:
-        """Determine data classification level"""
-        classification_map = {
-            'critical': 'confidential',
-            'high': 'restricted',
-            'medium': 'internal',
-            'low': 'public'
-        }
-        return classification_map.get(self.security_level, 'internal')
+    @property
+    def _max_risk(self) -> int:
+        """Maximum user risk score for the current security level"""
+        return 30 if self.security_level in config.HIGH_SECURITY_LEVELS else 50
     
     def check_access_permission(self, user_access_level: int, user_auth_method: str,
                                 device_trust_score: int, user_risk_score: int) -> Dict:
         """Check if access should be granted based on ZTA policies"""
-        reasons = []
-        granted = True
+        # Every failed check is reported, so all predicates are evaluated here
+        reason_bits = self._reason_bits(user_access_level, user_auth_method,
+                                        device_trust_score, user_risk_score)
         
-        # Check user access level
+        return {
+            'granted': not reason_bits,
+            'reasons': self.denial_reasons(reason_bits),
+            'security_level': self.security_level
+        }
+    
+    def _reason_bits(self, user_access_level: int, user_auth_method: str,
+                     device_trust_score: int, user_risk_score: int) -> int:
+        """DENY_* bits for a request, checked against the application's current policy"""
+        reason_bits = 0
         if user_access_level < self.required_access_level:
-            granted = False
-            reasons.append(f'Insufficient access level (required: {self.required_access_level})')
-        
-        # Check authentication method
+            reason_bits |= DENY_ACCESS_LEVEL
         if user_auth_method not in self.required_auth_methods:
-            granted = False
-            reasons.append(f'Authentication method not sufficient (required: {self.required_auth_methods})')
+            reason_bits |= DENY_AUTH_METHOD
+        if device_trust_score < self._min_trust:
+            reason_bits |= DENY_DEVICE_TRUST
+        if user_risk_score > self._max_risk:
+            reason_bits |= DENY_USER_RISK
+        return reason_bits
+    
+    def check_access_permission_bulk(self, user_access_levels: Sequence[int],
+                                     user_auth_methods: Sequence[str],
+                                     device_trust_scores: Sequence[int],
+                                     user_risk_scores: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check a batch of access requests against this application's ZTA policies.
+        Returns (granted, reason_bits): a bool array and a uint8 array with one
+        DENY_* bit per failed check, decoded with denial_reasons().
+        """
+        # Map methods to config.AUTH_METHOD_CODES (a code's bit in the mask); unknown methods are -1
+        codes = np.array([config.AUTH_METHOD_CODES.get(method, -1) for method in user_auth_methods], dtype=np.int64)
+        auth_mask = 0
+        for method in self.required_auth_methods:
+            if method in config.AUTH_METHOD_CODES:
+                auth_mask |= 1 << config.AUTH_METHOD_CODES[method]
+        auth_ok = (codes >= 0) & (((auth_mask >> codes.clip(min=0)) & 1) == 1)
+        for i in np.flatnonzero(codes < 0):
+            auth_ok[i] = user_auth_methods[i] in self.required_auth_methods
         
-        # Check device trust score
-        min_trust_score = 70 if self.security_level in ['critical', 'high'] else 50
-        if device_trust_score < min_trust_score:
-            granted = False
-            reasons.append(f'Device trust score too low (required: {min_trust_score})')
+        reason_bits = np.zeros(len(codes), dtype=np.uint8)
+        reason_bits[np.asarray(user_access_levels) < self.required_access_level] |= DENY_ACCESS_LEVEL
+        reason_bits[~auth_ok] |= DENY_AUTH_METHOD
+        reason_bits[np.asarray(device_trust_scores) < self._min_trust] |= DENY_DEVICE_TRUST
+        reason_bits[np.asarray(user_risk_scores) > self._max_risk] |= DENY_USER_RISK
         
-        # Check user risk score
-        max_risk_score = 30 if self.security_level in ['critical', 'high'] else 50
-        if user_risk_score > max_risk_score:
-            granted = False
-            reasons.append(f'User risk score too high (max: {max_risk_score})')
+        return reason_bits == 0, reason_bits
+    
+    def denial_reasons(self, reason_bits: int) -> List[str]:
+        """Decode bulk-check reason bits into the messages check_access_permission returns"""
+        if not reason_bits:
+            return ['Access granted']
         
-        return {
-            'granted': granted,
-            'reasons': reasons if not granted else ['Access granted'],
-            'security_level': self.security_level
-        }
+        reasons = []
+        if reason_bits & DENY_ACCESS_LEVEL:
+            reasons.append(f'Insufficient access level (required: {self.required_access_level})')
+        if reason_bits & DENY_AUTH_METHOD:
+            reasons.append(f'Authentication method not sufficient (required: {list(self.required_auth_methods)})')
+        if reason_bits & DENY_DEVICE_TRUST:
+            reasons.append(f'Device trust score too low (required: {self._min_trust})')
+        if reason_bits & DENY_USER_RISK:
+            reasons.append(f'User risk score too high (max: {self._max_risk})')
+        return reasons
     
     def log_access_attempt(self, user_id: str, device_id: str, granted: bool, timestamp):
         """Log an access attempt"""
-        self.access_logs.append({
-            'timestamp': timestamp,
+        pos = self._log_count % ACCESS_LOG_CAPACITY
+        if pos == len(self._log_ring):
+            ring = np.zeros(min(2 * pos, ACCESS_LOG_CAPACITY), dtype=ACCESS_LOG_DTYPE)
+            ring[:pos] = self._log_ring
+            self._log_ring = ring
+        
+        # Timestamps are stored as epoch microseconds
+        self._log_ring[pos] = (round(timestamp.timestamp() * 1_000_000), user_id, device_id, granted)
+        self._log_count += 1
+    
+    @property
+    def total_access_attempts(self) -> int:
+        """All access attempts ever logged, including ones aged out of the ring"""
+        return self._log_count
+    
+    @property
+    def access_logs(self) -> List[Dict]:
+        """Retained access attempts, oldest first"""
+        retained = self._log_ring[:min(self._log_count, ACCESS_LOG_CAPACITY)]
+        if self._log_count > ACCESS_LOG_CAPACITY:
+            retained = np.roll(retained, -(self._log_count % ACCESS_LOG_CAPACITY))
+        
+        return [{
+            'timestamp': datetime.fromtimestamp(ts / 1_000_000),
             'user_id': user_id,
             'device_id': device_id,
             'granted': granted
-        })
+        } for ts, user_id, device_id, granted in retained.tolist()]
     
     def get_application_info(self) -> Dict:
         """Return application information as dictionary"""
-        return {
-            'app_id': self.app_id,
-            'name': self.name,
-            'security_level': self.security_level,
-            'app_type': self.app_type,
-            'required_access_level': self.required_access_level,
-            'network_segment': self.network_segment,
-            'is_cloud_based': self.is_cloud_based,
-            'data_classification': self.data_classification,
-            'total_access_attempts': len(self.access_logs)
-        }
+        return dict(zip(self.INFO_COLUMNS, self.INFO_VALUES(self)))
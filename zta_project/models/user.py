@@ -2,77 +2,207 @@
 User model for ZTA simulation
 """
 import random
-import hashlib
+from collections import deque
+from operator import attrgetter
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
+import numpy as np
+import config
+from ._clock import sim_clock
+
+# Access level (1-5) by role
+ROLE_ACCESS_LEVELS = {
+    'employee': 2,
+    'contractor': 1,
+    'manager': 3,
+    'admin': 5,
+    'executive': 4
+}
+
+# Authentication methods a role may be assigned (shared tuples)
+PRIVILEGED_AUTH_METHODS = ('mfa', 'biometric', 'certificate')
+ROLE_AUTH_METHODS = {
+    'admin': PRIVILEGED_AUTH_METHODS,
+    'executive': PRIVILEGED_AUTH_METHODS,
+    'manager': ('mfa', 'biometric')
+}
+DEFAULT_AUTH_METHODS = ('password', 'mfa')
+
+# Authentication success rate by method: (with MFA code, without)
+AUTH_SUCCESS_RATES = {
+    'password': (0.85, 0.85),
+    'mfa': (0.95, 0.50)
+}
+DEFAULT_AUTH_SUCCESS_RATES = (0.98, 0.98)  # biometric or certificate
+
+# Success rates indexed by config.AUTH_METHOD_CODES; unknown methods use the last entry
+UNKNOWN_AUTH_CODE = len(config.AUTH_METHODS)
+SUCCESS_RATE_WITH_MFA = np.array(
+    [AUTH_SUCCESS_RATES.get(method, DEFAULT_AUTH_SUCCESS_RATES)[0] for method in config.AUTH_METHODS]
+    + [DEFAULT_AUTH_SUCCESS_RATES[0]])
+SUCCESS_RATE_WITHOUT_MFA = np.array(
+    [AUTH_SUCCESS_RATES.get(method, DEFAULT_AUTH_SUCCESS_RATES)[1] for method in config.AUTH_METHODS]
+    + [DEFAULT_AUTH_SUCCESS_RATES[1]])
+
+
+
+def encode_auth_method(method: str) -> int:
+    """Map an authentication method to its code into the success-rate tables"""
+    return config.AUTH_METHOD_CODES.get(method, UNKNOWN_AUTH_CODE)
+
+
+SIMULATED_MFA_CODE = '123456'  # Code submitted on behalf of MFA users in simulated logins
+USER_HISTORY_SIZE = 1000  # Most recent logins and accesses kept per user
+
+
+class UserRegistry:
+    """Columnar store of per-user authentication state; each User is a view onto one slot"""
+    
+    COLUMNS = (('auth_code', np.int8), ('failed_login_attempts', np.int32), ('last_login', np.int64))
+    
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        for name, dtype in self.COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _grow(self):
+        """Double the capacity of every column"""
+        capacity = max(1, 2 * len(self.auth_code))
+        for name, dtype in self.COLUMNS:
+            column = np.zeros(capacity, dtype=dtype)
+            column[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, column)
+    
+    def add_user(self, authentication_method: str) -> int:
+        """Allocate a slot for a user and return its index"""
+        if self.size == len(self.auth_code):
+            self._grow()
+        
+        idx = self.size
+        self.auth_code[idx] = encode_auth_method(authentication_method)
+        self.failed_login_attempts[idx] = 0
+        self.last_login[idx] = 0  # Epoch microseconds; 0 means never logged in
+        self.size += 1
+        return idx
+    
+    def authenticate_bulk(self, indices: np.ndarray, has_mfa_code: np.ndarray,
+                          rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Simulate a batch of authentication attempts, applied in order, and return
+        the success of each. Login histories are not appended on this path.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        indices = np.asarray(indices, dtype=np.intp)
+        has_mfa_code = np.asarray(has_mfa_code, dtype=bool)
+        n = len(indices)
+        
+        codes = self.auth_code[indices]
+        rates = np.where(has_mfa_code, SUCCESS_RATE_WITH_MFA[codes], SUCCESS_RATE_WITHOUT_MFA[codes])
+        success = rng.random(n) < rates
+        
+        # A success resets the failure count, so only failures after each slot's last success add up
+        positions = np.arange(n)
+        last_success = np.full(self.size, -1, dtype=np.intp)
+        np.maximum.at(last_success, indices[success], positions[success])
+        trailing = ~success & (positions > last_success[indices])
+        trailing_failures = np.bincount(indices[trailing], minlength=self.size)[:self.size]
+        
+        touched = np.unique(indices)
+        reset = last_success[touched] >= 0
+        self.failed_login_attempts[touched] = np.where(
+            reset, 0, self.failed_login_attempts[touched]) + trailing_failures[touched]
+        self.last_login[touched[reset]] = round(sim_clock.now().timestamp() * 1_000_000)
+        
+        return success
+
 
 
 class User:
     """Represents a user in the hybrid work environment"""
     
-    def __init__(self, user_id: str, name: str, role: str, location: str, department: str):
+    # Authentication state (method code, failed attempts, last login) lives in the registry
+    __slots__ = ('user_id', 'name', 'role', 'location', 'department', 'created_at', '_registry', '_idx',
+                 'risk_score', '_authentication_method', 'access_level', 'is_active',
+                 'login_history', 'access_patterns')
+    
+    # get_user_info columns and the attributes they are read from
+    INFO_FIELDS = (('user_id', 'user_id'), ('name', 'name'), ('role', 'role'), ('location', 'location'),
+                   ('department', 'department'), ('risk_score', 'risk_score'),
+                   ('access_level', 'access_level'), ('auth_method', 'authentication_method'),
+                   ('failed_attempts', 'failed_login_attempts'), ('is_active', 'is_active'))
+    INFO_COLUMNS = tuple(column for column, _ in INFO_FIELDS)
+    INFO_VALUES = attrgetter(*(attr for _, attr in INFO_FIELDS))
+    
+    def __init__(self, user_id: str, name: str, role: str, location: str, department: str,
+                 registry: Optional[UserRegistry] = None):
         self.user_id = user_id
         self.name = name
         self.role = role
         self.location = location
         self.department = department
-        self.created_at = datetime.now()
-        self.last_login = None
-        self.failed_login_attempts = 0
+        self.created_at = sim_clock.now()
         self.risk_score = random.randint(0, 30)  # Initial low risk
-        self.authentication_method = self._assign_auth_method()
-        self.access_level = self._determine_access_level()
+        authentication_method = random.choice(ROLE_AUTH_METHODS.get(role, DEFAULT_AUTH_METHODS))
+        self._authentication_method = authentication_method
+        self._registry = registry if registry is not None else UserRegistry(capacity=1)
+        self._idx = self._registry.add_user(authentication_method)
+        self.access_level = ROLE_ACCESS_LEVELS.get(role, 1)
         self.is_active = True
-        self.login_history = []
-        self.access_patterns = []
-        
-    def _assign_auth_method(self) -> str:
-        """Assign authentication method based on role"""
-        if self.role in ['admin', 'executive']:
-            return random.choice(['mfa', 'biometric', 'certificate'])
-        elif self.role == 'manager':
-            return random.choice(['mfa', 'biometric'])
-        else:
-            return random.choice(['password', 'mfa'])
-    
-    def _determine_access_level(self) -> int:
-        """Determine access level (1-5) based on role"""
-        access_mapping = {
-            'employee': 2,
-            'contractor': 1,
-            'manager': 3,
-            'admin': 5,
-            'executive': 4
-        }
-        return access_mapping.get(self.role, 1)
+        self.login_history = deque(maxlen=USER_HISTORY_SIZE)
+        self.access_patterns = deque(maxlen=USER_HISTORY_SIZE)
+    
+    @property
+    def authentication_method(self) -> str:
+        return self._authentication_method
+    
+    @authentication_method.setter
+    def authentication_method(self, value: str):
+        self._authentication_method = value
+        self._registry.auth_code[self._idx] = encode_auth_method(value)
+    
+    @property
+    def mfa_token(self) -> Optional[str]:
+        """Code submitted for this user in simulated logins (MFA users only)"""
+        return SIMULATED_MFA_CODE if self._authentication_method == 'mfa' else None
+    
+    @property
+    def failed_login_attempts(self) -> int:
+        return int(self._registry.failed_login_attempts[self._idx])
+    
+    @failed_login_attempts.setter
+    def failed_login_attempts(self, value: int):
+        self._registry.failed_login_attempts[self._idx] = value
+    
+    @property
+    def last_login(self) -> Optional[datetime]:
+        last_login = int(self._registry.last_login[self._idx])
+        return datetime.fromtimestamp(last_login / 1_000_000) if last_login else None
+    
+    @last_login.setter
+    def last_login(self, value: Optional[datetime]):
+        self._registry.last_login[self._idx] = round(value.timestamp() * 1_000_000) if value else 0
     
     def authenticate(self, password: str, mfa_code: str = None) -> bool:
         """Simulate authentication process"""
         # Simulate authentication success rate
-        if self.authentication_method == 'password':
-            success_rate = 0.85
-        elif self.authentication_method == 'mfa':
-            success_rate = 0.95 if mfa_code else 0.50
-        else:  # biometric or certificate
-            success_rate = 0.98
-        
-        success = random.random() < success_rate
+        with_mfa, without_mfa = AUTH_SUCCESS_RATES.get(self.authentication_method, DEFAULT_AUTH_SUCCESS_RATES)
+        success = random.random() < (with_mfa if mfa_code else without_mfa)
         
+        now = sim_clock.now()
         if success:
             self.failed_login_attempts = 0
-            self.last_login = datetime.now()
-            self.login_history.append({
-                'timestamp': datetime.now(),
-                'success': True,
-                'method': self.authentication_method
-            })
+            self.last_login = now
         else:
             self.failed_login_attempts += 1
-            self.login_history.append({
-                'timestamp': datetime.now(),
-                'success': False,
-                'method': self.authentication_method
-            })
+        self.login_history.append({
+            'timestamp': now,
+            'success': success,
+            'method': self.authentication_method
+        })
         
         return success
     
@@ -95,7 +225,7 @@ class User:
     def record_access(self, resource: str, action: str, granted: bool):
         """Record access attempt to a resource"""
         self.access_patterns.append({
-            'timestamp': datetime.now(),
+            'timestamp': sim_clock.now(),
             'resource': resource,
             'action': action,
             'granted': granted
@@ -103,15 +233,4 @@ class User:
     
     def get_user_info(self) -> Dict:
         """Return user information as dictionary"""
-        return {
-            'user_id': self.user_id,
-            'name': self.name,
-            'role': self.role,
-            'location': self.location,
-            'department': self.department,
-            'risk_score': self.risk_score,
-            'access_level': self.access_level,
-            'auth_method': self.authentication_method,
-            'failed_attempts': self.failed_login_attempts,
-            'is_active': self.is_active
-        }
+        return dict(zip(self.INFO_COLUMNS, self.INFO_VALUES(self)))
@@ -2,15 +2,42 @@
 """
 Comprehensive Test Suite - Runs ALL tests and verifies expected outputs
 Tests every component and improvement
+Pass --verbose to print full tracebacks of crashed tests
+Pass --samples N (or set ZTA_TEST_SAMPLES) to size the shared training history
 """
 
+import argparse
 import sys
 import os
-from datetime import datetime
+import io
+import contextlib
+import functools
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 import traceback
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Imported once for the ML tests; missing packages are reported by the dependency test
+try:
+    import numpy as np
+    import pandas as pd
+    from core.ai_engine import BehavioralAnalyticsModel, AIAnomalyDetector
+    ML_IMPORTS_AVAILABLE = True
+except ImportError:
+    ML_IMPORTS_AVAILABLE = False
+
+# Labels cycled through by the synthetic behavior histories
+TEST_RESOURCES = tuple(f'resource_{j}' for j in range(5))
+TEST_LOCATIONS = tuple(f'location_{j}' for j in range(3))
+TEST_DEVICES = tuple(f'device_{j}' for j in range(2))
+
+# Set from the command line by main(), and in each worker process by configure()
+VERBOSE = False  # Print full tracebacks of crashed tests
+TRAINING_SAMPLES = 20  # Behaviors used to train the shared model
+RULE = "=" * 70  # Frames the suite banner, each test header and the summary
+
 # Test results tracker
 test_results = []
 total_tests = 0
@@ -31,16 +58,51 @@ def test_result(test_name, passed, message=""):
 
 def print_header(title):
     """Print test section header"""
-    print(f"\n{'='*70}")
-    print(f"{title}")
-    print(f"{'='*70}\n")
+    print(f"\n{RULE}\n{title}\n{RULE}\n")
+
+def make_behavior_history(n, base_time, step_hours=2, with_rates=False, seed=0):
+    """Synthetic behavior history with one row per behavior, built column-wise"""
+    i = np.arange(n)
+    timestamps = np.datetime64(base_time, 'us') + (i * step_hours).astype('timedelta64[h]')
+    history = pd.DataFrame({
+        'timestamp': timestamps,
+        'hour': 9 + (i % 8),
+        'day_of_week': i % 7,
+        'resource': np.array(TEST_RESOURCES)[i % len(TEST_RESOURCES)],
+        'location': np.array(TEST_LOCATIONS)[i % len(TEST_LOCATIONS)],
+        'device_id': np.array(TEST_DEVICES)[i % len(TEST_DEVICES)],
+        'date': timestamps.astype('datetime64[D]').astype(str),
+        'success': True,
+        'failed_auth': False
+    })
+    if with_rates:
+        history['access_rate'] = 1.0 + np.random.default_rng(seed).random(n) * 0.5
+        history['location_changes'] = 0
+    return history
+
+@functools.lru_cache(maxsize=1)
+def trained_model():
+    """Model trained once on TRAINING_SAMPLES behaviors of 'test_user'; shared read-only by the ML tests"""
+    model = BehavioralAnalyticsModel()
+    base_time = datetime.now() - timedelta(days=30)
+    model.train_user_model('test_user', make_behavior_history(TRAINING_SAMPLES, base_time, with_rates=True))
+    return model
+
+@functools.lru_cache(maxsize=1)
+def shared_environment():
+    """Realistic environment set up once; tests that simulate days work on a deep copy"""
+    from simulation.environment import HybridWorkEnvironment
+    
+    env = HybridWorkEnvironment(use_realistic_generation=True)
+    env.setup_environment()
+    return env
 
 def test_1_ml_model_import():
     """Test 1: ML Model Import and Basic Functionality"""
     print_header("TEST 1: ML Model Import and Basic Functionality")
     
     try:
-        from core.ai_engine import BehavioralAnalyticsModel
+        assert ML_IMPORTS_AVAILABLE, "Could not import core.ai_engine"
         model = BehavioralAnalyticsModel()
         
         # Check model has required attributes
@@ -57,33 +119,8 @@ def test_2_ml_model_training():
     print_header("TEST 2: ML Model Training")
     
     try:
-        from core.ai_engine import BehavioralAnalyticsModel
-        from datetime import datetime, timedelta
-        import numpy as np
-        
-        model = BehavioralAnalyticsModel()
-        
-        # Generate training data
-        behavior_history = []
-        base_time = datetime.now() - timedelta(days=30)
-        
-        for i in range(50):
-            behavior_history.append({
-                'timestamp': base_time + timedelta(hours=i*2),
-                'hour': 9 + (i % 8),
-                'day_of_week': i % 7,
-                'resource': f'resource_{i % 5}',
-                'location': f'location_{i % 3}',
-                'device_id': f'device_{i % 2}',
-                'date': str((base_time + timedelta(hours=i*2)).date()),
-                'success': True,
-                'failed_auth': False,
-                'access_rate': 1.0 + np.random.random() * 0.5,
-                'location_changes': 0
-            })
-        
-        # Train model
-        model.train_user_model('test_user', behavior_history)
+        # Train model (shared with the prediction and feature tests)
+        model = trained_model()
         
         # Verify training
         stats = model.get_model_statistics('test_user')
@@ -100,29 +137,7 @@ def test_3_ml_model_prediction():
     print_header("TEST 3: ML Model Prediction")
     
     try:
-        from core.ai_engine import BehavioralAnalyticsModel
-        from datetime import datetime, timedelta
-        import numpy as np
-        
-        model = BehavioralAnalyticsModel()
-        
-        # Generate and train
-        behavior_history = []
-        base_time = datetime.now() - timedelta(days=30)
-        for i in range(50):
-            behavior_history.append({
-                'timestamp': base_time + timedelta(hours=i*2),
-                'hour': 9 + (i % 8),
-                'day_of_week': i % 7,
-                'resource': f'resource_{i % 5}',
-                'location': f'location_{i % 3}',
-                'device_id': f'device_{i % 2}',
-                'date': str((base_time + timedelta(hours=i*2)).date()),
-                'success': True,
-                'failed_auth': False
-            })
-        
-        model.train_user_model('test_user', behavior_history)
+        model = trained_model()
         
         # Test prediction
         behavior = {
@@ -145,9 +160,6 @@ def test_4_anomaly_detector():
     print_header("TEST 4: AI Anomaly Detector")
     
     try:
-        from core.ai_engine import AIAnomalyDetector
-        from datetime import datetime, timedelta
-        
         detector = AIAnomalyDetector()
         
         # Check components
@@ -227,10 +239,7 @@ def test_7_environment_setup():
     print_header("TEST 7: Environment Setup")
     
     try:
-        from simulation.environment import HybridWorkEnvironment
-        
-        env = HybridWorkEnvironment(use_realistic_generation=True)
-        env.setup_environment()
+        env = shared_environment()
         
         assert len(env.users) > 0, "No users created"
         assert len(env.devices) > 0, "No devices created"
@@ -247,18 +256,14 @@ def test_8_train_test_separation():
     print_header("TEST 8: Train/Test Separation")
     
     try:
-        from simulation.environment import HybridWorkEnvironment
-        
-        env = HybridWorkEnvironment(use_realistic_generation=True)
-        env.setup_environment()
+        env = copy.deepcopy(shared_environment())
         
         # Set training phase
         env.set_training_phase(True, training_days=5)
         env.identity_manager.set_training_phase(True)
         
         # Simulate training days
-        for day in range(1, 6):
-            env.simulate_day(day)
+        env.simulate_days(range(1, 6))
         
         initial_count = len(env.identity_manager.ai_detector.behavioral_model.user_models)
         
@@ -267,8 +272,7 @@ def test_8_train_test_separation():
         env.identity_manager.set_training_phase(False)
         
         # Simulate test days
-        for day in range(6, 8):
-            env.simulate_day(day)
+        env.simulate_days(range(6, 8))
         
         final_count = len(env.identity_manager.ai_detector.behavioral_model.user_models)
         
@@ -285,10 +289,7 @@ def test_9_identity_manager_ai():
     print_header("TEST 9: Identity Manager AI Integration")
     
     try:
-        from simulation.environment import HybridWorkEnvironment
-        
-        env = HybridWorkEnvironment(use_realistic_generation=True)
-        env.setup_environment()
+        env = shared_environment()
         
         assert hasattr(env.identity_manager, 'ai_detector'), "Missing ai_detector"
         assert hasattr(env.identity_manager, 'set_training_phase'), "Missing set_training_phase"
@@ -309,23 +310,10 @@ def test_10_feature_engineering():
     print_header("TEST 10: Feature Engineering")
     
     try:
-        from core.ai_engine import BehavioralAnalyticsModel
-        from datetime import datetime, timedelta
-        
-        model = BehavioralAnalyticsModel()
+        model = trained_model()
         
-        # Check feature extraction
-        behavior_history = [{
-            'timestamp': datetime.now() - timedelta(hours=i),
-            'hour': 9 + (i % 8),
-            'day_of_week': i % 7,
-            'resource': f'resource_{i % 5}',
-            'location': f'location_{i % 3}',
-            'device_id': f'device_{i % 2}',
-            'date': str((datetime.now() - timedelta(hours=i)).date()),
-            'success': True,
-            'failed_auth': False
-        } for i in range(20)]
+        # Check feature extraction (hourly, going back from now)
+        behavior_history = make_behavior_history(20, datetime.now(), step_hours=-1)
         
         # Extract features
         features = model._extract_features(behavior_history)
@@ -383,16 +371,315 @@ def test_12_dependencies():
     else:
         return test_result("All Dependencies", True, "All dependencies installed")
 
+def test_13_bulk_access_check():
+    """Test 13: Bulk Application Access Check"""
+    print_header("TEST 13: Bulk Application Access Check")
+    
+    try:
+        import random
+        from models.application import Application
+        
+        rng = random.Random(0)
+        methods = ('password', 'mfa', 'biometric', 'certificate', 'sso')  # 'sso' is outside the vocabulary
+        requests = [(rng.randint(0, 5), rng.choice(methods), rng.randint(0, 100), rng.randint(0, 100))
+                    for _ in range(200)]
+        
+        for security_level in ('low', 'medium', 'high', 'critical'):
+            app = Application('APP-TEST', 'Test App', security_level, 'web')
+            granted, reason_bits = app.check_access_permission_bulk(*zip(*requests))
+            for request, row_granted, row_bits in zip(requests, granted, reason_bits):
+                single = app.check_access_permission(*request)
+                assert bool(row_granted) == single['granted'], f"Grant mismatch for {security_level} {request}"
+                assert app.denial_reasons(int(row_bits)) == single['reasons'], \
+                    f"Reason mismatch for {security_level} {request}"
+        
+        return test_result("Bulk Access Check", True,
+                          f"Bulk matches per-request checks on {len(requests)} requests per level")
+    except Exception as e:
+        return test_result("Bulk Access Check", False, str(e))
+
+def test_14_access_controller_bulk_check():
+    """Test 14: Access Controller Bulk Check"""
+    print_header("TEST 14: Access Controller Bulk Check")
+    
+    try:
+        import random
+        from core.access_controller import DENY_NOT_FOUND
+        
+        env = copy.deepcopy(shared_environment())
+        controller = env.access_controller
+        identity_manager = env.identity_manager
+        identity_manager.enable_continuous_auth = False  # Not evaluated by bulk_check
+        
+        rng = random.Random(0)
+        triples = [(rng.choice(env.users).user_id, rng.choice(env.devices).device_id,
+                    rng.choice(env.applications).app_id) for _ in range(200)]
+        triples += [('USER-MISSING', env.devices[0].device_id, env.applications[0].app_id),
+                    (env.users[0].user_id, 'DEV-MISSING', env.applications[0].app_id),
+                    (env.users[0].user_id, env.devices[0].device_id, 'APP-MISSING')]
+        granted, reason_bits = controller.bulk_check(triples)
+        
+        compared = 0
+        for (user_id, device_id, app_id), row_granted, row_bits in zip(triples, granted, reason_bits):
+            user = identity_manager.users.get(user_id)
+            device = env.device_manager.devices.get(device_id)
+            application = controller.applications.get(app_id)
+            if user is None or device is None or application is None:
+                assert not row_granted and row_bits == DENY_NOT_FOUND, f"Unregistered {user_id}/{device_id}/{app_id}"
+                continue
+            
+            # Same decision and reasons as the application's own check
+            single = application.check_access_permission(
+                user.access_level, user.authentication_method, device.trust_score, user.risk_score)
+            assert bool(row_granted) == single['granted'], f"Grant mismatch for {user_id}/{device_id}/{app_id}"
+            assert application.denial_reasons(int(row_bits)) == single['reasons'], \
+                f"Reason mismatch for {user_id}/{device_id}/{app_id}"
+            
+            # request_access agrees wherever its session and device checks pass (a denial raises
+            # the user's risk score, so it is restored to keep later rows comparable)
+            risk_score = user.risk_score
+            result = controller.request_access(identity_manager._create_session(user_id), device_id, app_id)
+            user.risk_score = risk_score
+            if result['access_granted']:
+                assert row_granted, f"request_access granted {user_id}/{device_id}/{app_id}, bulk denied"
+                compared += 1
+            elif not result['reason'].startswith('Device'):
+                assert result['reason'] == '; '.join(application.denial_reasons(int(row_bits))), \
+                    f"request_access reason mismatch for {user_id}/{device_id}/{app_id}"
+                compared += 1
+        
+        assert compared > 0, "No request reached the application check"
+        return test_result("Access Controller Bulk Check", True,
+                          f"Bulk matches per-request checks ({compared} also via request_access)")
+    except Exception as e:
+        return test_result("Access Controller Bulk Check", False, str(e))
+
+def test_15_bulk_posture_check():
+    """Test 15: Bulk Device Posture Check"""
+    print_header("TEST 15: Bulk Device Posture Check")
+    
+    try:
+        import random
+        import numpy as np
+        from models import device as device_module
+        
+        rng = random.Random(0)
+        registry = device_module.DeviceRegistry()
+        for _ in range(300):
+            registry.add_device(rng.randint(0, 100), rng.random() < 0.75, rng.randrange(64),
+                                rng.choice(device_module.POSTURE_LEVELS), 'office')
+        columns = ('checks_bits', 'trust_score', 'is_compliant', 'posture_code')
+        
+        def run(numba_available, kernel):
+            """Posture-check a copy of the registry with the given code path and a fixed seed"""
+            saved = device_module.NUMBA_AVAILABLE, device_module.posture_step
+            device_module.NUMBA_AVAILABLE, device_module.posture_step = numba_available, kernel
+            try:
+                result = copy.deepcopy(registry)
+                result.perform_posture_check_all(np.random.default_rng(7))
+                return result
+            finally:
+                device_module.NUMBA_AVAILABLE, device_module.posture_step = saved
+        
+        # The NumPy fallback, the kernel's Python body and the configured path all agree
+        kernel = device_module.posture_step
+        fallback = run(False, kernel)
+        python_kernel = run(True, getattr(kernel, 'py_func', kernel))
+        configured = run(device_module.NUMBA_AVAILABLE, kernel)
+        for column in columns:
+            expected = getattr(fallback, column)
+            assert np.array_equal(expected, getattr(python_kernel, column)), f"Kernel differs on {column}"
+            assert np.array_equal(expected, getattr(configured, column)), f"Configured path differs on {column}"
+        
+        assert not np.array_equal(fallback.checks_bits, registry.checks_bits), "No checks changed"
+        assert fallback.trust_score.min() >= 0 and fallback.trust_score.max() <= 100, "Trust score out of range"
+        
+        path = "Numba" if device_module.NUMBA_AVAILABLE else "NumPy fallback"
+        return test_result("Bulk Posture Check", True, f"Fallback matches kernel ({path} configured)")
+    except Exception as e:
+        return test_result("Bulk Posture Check", False, str(e))
+
+def test_16_bulk_device_creation():
+    """Test 16: Bulk Device Creation"""
+    print_header("TEST 16: Bulk Device Creation")
+    
+    try:
+        import numpy as np
+        from models import Device, DeviceRegistry
+        
+        # The environment's devices are views onto its own registry
+        env = shared_environment()
+        assert len(env.device_registry) == len(env.devices), "Registry size differs from device count"
+        assert all(device._registry is env.device_registry for device in env.devices), "Device outside registry"
+        assert sorted(device._idx for device in env.devices) == list(range(len(env.devices))), "Slots not distinct"
+        
+        def create(seed):
+            n = 2000
+            registry = DeviceRegistry()
+            devices = Device.bulk_create([f"D{i}" for i in range(n)], ['laptop'] * n, ['U1'] * n,
+                                         ['Windows 11'] * n, registry=registry, rng=np.random.default_rng(seed))
+            return registry, devices
+        
+        registry, devices = create(1)
+        repeat, _ = create(1)
+        for name, _ in DeviceRegistry.COLUMNS:
+            if name not in ('last_seen', 'patch_epoch'):  # Relative to the wall clock
+                assert np.array_equal(getattr(registry, name), getattr(repeat, name)), f"Seeded {name} differs"
+        
+        # Same ranges and rates as devices created one at a time
+        assert all(60 <= device.trust_score <= 100 for device in devices), "Trust score out of range"
+        assert all(0 <= device.days_since_patch <= 90 for device in devices), "Patch age out of range"
+        for device in devices[:50]:
+            assert device.security_posture == Device._posture_for_checks(device._checks), "Posture mismatch"
+        compliant_rate = sum(device.is_compliant for device in devices) / len(devices)
+        managed_rate = sum(device.is_managed for device in devices) / len(devices)
+        assert 0.70 < compliant_rate < 0.80 and 0.70 < managed_rate < 0.80, "Compliance/managed rates off"
+        
+        return test_result("Bulk Device Creation", True,
+                          f"Seeded bulk creation is reproducible ({compliant_rate:.0%} compliant)")
+    except Exception as e:
+        return test_result("Bulk Device Creation", False, str(e))
+
+def test_17_parallel_breach_simulation():
+    """Test 17: Parallel Breach Simulation"""
+    print_header("TEST 17: Parallel Breach Simulation")
+    
+    try:
+        from simulation.breach_simulator import BreachSimulator, _run_seeded_iteration
+        
+        def comparable(results):
+            return [{key: value for key, value in result.items() if key != 'timestamp'} for result in results]
+        
+        env = shared_environment()
+        iterations, seed = 3, 11
+        
+        # Serial run of the same seeded iterations, each on a fresh copy of the environment
+        serial = []
+        for i in range(iterations):
+            results, _ = _run_seeded_iteration(env, i, iterations, seed + i)
+            serial.extend(results)
+        
+        simulator = BreachSimulator(env)
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulator.run_all_breach_scenarios_parallel(iterations=iterations, n_cores=2, seed=seed)
+        
+        assert comparable(simulator.breach_attempts) == comparable(serial), "Parallel results differ from serial"
+        stats = simulator.get_breach_statistics()
+        assert stats['total_attempts'] == len(serial), "Attempt count mismatch"
+        
+        return test_result("Parallel Breach Simulation", True,
+                          f"{len(serial)} seeded attempts match the serial run")
+    except Exception as e:
+        return test_result("Parallel Breach Simulation", False, str(e))
+
+def test_18_device_locations():
+    """Test 18: Device Location Table"""
+    print_header("TEST 18: Device Location Table")
+    
+    try:
+        from models import Device, DeviceRegistry
+        
+        registry = DeviceRegistry()
+        devices = [Device(f"D{i}", 'laptop', 'U1', 'Windows 11', registry=registry) for i in range(3)]
+        locations = [f"branch_{i}" for i in range(300)]  # Well past the int8 range
+        for i, location in enumerate(locations):
+            devices[i % len(devices)].location = location
+            assert devices[i % len(devices)].location == location, f"Location {location} not kept"
+        
+        assert [device.location for device in devices] == locations[-3:], "Final locations wrong"
+        assert len(registry.locations) == len(locations) + 3, "Location table size wrong"
+        
+        return test_result("Device Location Table", True, f"{len(registry.locations)} distinct locations stored")
+    except Exception as e:
+        return test_result("Device Location Table", False, str(e))
+
+def test_19_temporal_split():
+    """Test 19: Temporal Train/Test Split"""
+    print_header("TEST 19: Temporal Train/Test Split")
+    
+    try:
+        from data_loader import RealWorldDataLoader
+        
+        # Shuffled behaviors with repeated timestamps
+        n = 500
+        rng = np.random.default_rng(0)
+        timestamps = np.datetime64('2024-01-01T00:00', 'us') + rng.integers(0, 100, n).astype('timedelta64[h]')
+        behaviors = pd.DataFrame({'timestamp': timestamps, 'row': np.arange(n)})
+        
+        train, test = RealWorldDataLoader()._temporal_split(behaviors, 0.7)
+        expected = behaviors.sort_values('timestamp', kind='stable')
+        
+        assert len(train) == int(n * 0.7) and len(train) + len(test) == n, "Split sizes wrong"
+        assert train['timestamp'].is_monotonic_increasing, "Training side not in time order"
+        assert test['timestamp'].is_monotonic_increasing, "Test side not in time order"
+        assert train['row'].tolist() + test['row'].tolist() == expected['row'].tolist(), \
+            "Split differs from a stable sort by timestamp"
+        
+        return test_result("Temporal Split", True, f"{len(train)}/{len(test)} split, both sides in time order")
+    except Exception as e:
+        return test_result("Temporal Split", False, str(e))
+
+def configure(verbose, training_samples):
+    """Apply the command-line options (also run in each worker process)"""
+    global VERBOSE, TRAINING_SAMPLES
+    VERBOSE = verbose
+    TRAINING_SAMPLES = training_samples
+
+def parse_args():
+    """Parse the command line, exiting with a usage error on bad values"""
+    def positive_int(value):
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+        return number
+    
+    parser = argparse.ArgumentParser(description="Run the comprehensive ZTA test suite")
+    parser.add_argument('--verbose', action='store_true', help="print full tracebacks of crashed tests")
+    parser.add_argument('--samples', type=positive_int, metavar='N',
+                        help="behaviors used to train the shared model (default: $ZTA_TEST_SAMPLES or 20)")
+    args = parser.parse_args()
+    if args.samples is None:
+        env_samples = os.environ.get('ZTA_TEST_SAMPLES', '20')
+        try:
+            args.samples = positive_int(env_samples)
+        except argparse.ArgumentTypeError as e:
+            parser.error(f"ZTA_TEST_SAMPLES: {e}")
+    return args
+
+def run_test(test_func):
+    """Run one test, recording a crash as a failure"""
+    try:
+        return test_func()
+    except Exception as e:
+        error = ''.join(traceback.format_exception_only(type(e), e)).strip()
+        test_result(test_func.__name__, False, f"Test crashed: {error}")
+        if VERBOSE:
+            traceback.print_exc()
+        return False
+
+def run_captured(test_func):
+    """Run one test in a worker process, returning its output and the results it recorded"""
+    first_result = len(test_results)  # Workers are reused across tests
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        run_test(test_func)
+    return output.getvalue(), test_results[first_result:]
+
 def main():
     """Run all tests"""
-    print("\n" + "="*70)
+    args = parse_args()
+    configure(args.verbose, args.samples)
+    
+    print("\n" + RULE)
     print("COMPREHENSIVE TEST SUITE - ALL IMPROVEMENTS")
-    print("="*70)
+    print(RULE)
     print("\nTesting all components and improvements...")
     
     # Run all tests
     tests = [
-        test_12_dependencies,  # Check dependencies first
         test_1_ml_model_import,
         test_2_ml_model_training,
         test_3_ml_model_prediction,
@@ -404,37 +691,55 @@ def main():
         test_9_identity_manager_ai,
         test_10_feature_engineering,
         test_11_experiment_runner,
+        test_13_bulk_access_check,
+        test_14_access_controller_bulk_check,
+        test_15_bulk_posture_check,
+        test_16_bulk_device_creation,
+        test_17_parallel_breach_simulation,
+        test_18_device_locations,
+        test_19_temporal_split,
     ]
     
-    for test_func in tests:
-        try:
-            test_func()
-        except Exception as e:
-            test_result(test_func.__name__, False, f"Test crashed: {str(e)}")
-            traceback.print_exc()
-    
-    # Print summary
-    print_header("TEST SUMMARY")
-    
-    print(f"Total Tests: {total_tests}")
-    print(f"Passed: {passed_tests}")
-    print(f"Failed: {total_tests - passed_tests}")
-    print(f"Success Rate: {passed_tests/total_tests*100:.1f}%")
-    
-    print("\nDetailed Results:")
-    print("-" * 70)
-    for test_name, passed, message in test_results:
-        status = "[PASS]" if passed else "[FAIL]"
-        print(f"{status} {test_name}")
-        if message and not passed:
-            print(f"    Error: {message}")
-    
-    print("\n" + "="*70)
-    if passed_tests == total_tests:
-        print("[SUCCESS] ALL TESTS PASSED! Everything is working correctly.")
+    # Check dependencies first; without them every other test would only crash on import.
+    # The tests are independent and run in worker processes, each test's output printed
+    # as a block in the original order
+    if run_test(test_12_dependencies):
+        global total_tests, passed_tests
+        with ProcessPoolExecutor(initializer=configure, initargs=(VERBOSE, TRAINING_SAMPLES)) as executor:
+            for output, results in executor.map(run_captured, tests):
+                sys.stdout.write(output)
+                test_results.extend(results)
+                total_tests += len(results)
+                passed_tests += sum(passed for _, passed, _ in results)
     else:
-        print(f"[WARNING] {total_tests - passed_tests} test(s) failed. Check errors above.")
-    print("="*70 + "\n")
+        print("\n[ERROR] Aborting suite: required dependencies are missing (see above)")
+    
+    # Print summary, assembled first and written in one go
+    summary = io.StringIO()
+    with contextlib.redirect_stdout(summary):
+        print_header("TEST SUMMARY")
+        
+        print(f"Total Tests: {total_tests}")
+        print(f"Passed: {passed_tests}")
+        print(f"Failed: {total_tests - passed_tests}")
+        print(f"Success Rate: {passed_tests/total_tests*100:.1f}%")
+        
+        print("\nDetailed Results:")
+        print("-" * 70)
+        for test_name, passed, message in test_results:
+            status = "[PASS]" if passed else "[FAIL]"
+            print(f"{status} {test_name}")
+            if message and not passed:
+                print(f"    Error: {message}")
+        
+        print("\n" + RULE)
+        if passed_tests == total_tests:
+            print("[SUCCESS] ALL TESTS PASSED! Everything is working correctly.")
+        else:
+            print(f"[WARNING] {total_tests - passed_tests} test(s) failed. Check errors above.")
+        print(RULE + "\n")
+    sys.stdout.write(summary.getvalue())
+    sys.stdout.flush()
     
     return passed_tests == total_tests
 
@@ -21,17 +21,21 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from simulation.experiment import ExperimentRunner
 
+# Experiment banner, printed in one write
+HEADER_BANNER = "\n".join([
+    "\n" + "=" * 80,
+    "ZERO TRUST ARCHITECTURE COMPARATIVE EXPERIMENT",
+    "Implementing Research Methodology:",
+    "Developing a Zero Trust Cybersecurity Framework for Malware Prevention",
+    "\nThis experiment compares:",
+    "  - Baseline Scenario (Traditional Security)",
+    "  - ZTA Scenario (Zero Trust Architecture)",
+    "=" * 80 + "\n"
+])
+
 def print_header():
     """Print experiment header"""
-    print("\n" + "="*80)
-    print("ZERO TRUST ARCHITECTURE COMPARATIVE EXPERIMENT")
-
-    print("Implementing Research Methodology:")
-    print("Developing a Zero Trust Cybersecurity Framework for Malware Prevention")
-    print("\nThis experiment compares:")
-    print("  - Baseline Scenario (Traditional Security)")
-    print("  - ZTA Scenario (Zero Trust Architecture)")
-    print("="*80 + "\n")
+    print(HEADER_BANNER)
 
 def main():
     """Main execution function"""
@@ -50,26 +54,24 @@ def main():
         # Print summary
         comparison = results['comparison']
         
-        print(f"\n{'='*80}")
-        print("EXPERIMENT RESULTS SUMMARY")
-        print(f"{'='*80}")
-        
-        print("\nBreach Prevention:")
-        print(f"  Baseline Rate: {comparison['breach_prevention']['baseline_rate']*100:.1f}%")
-        print(f"  ZTA Rate: {comparison['breach_prevention']['zta_rate']*100:.1f}%")
-        print(f"  Improvement: {comparison['breach_prevention']['improvement_percent']:.1f}%")
-        
-        print("\nSecurity Metrics:")
-        print(f"  Security Score Improvement: {comparison['security_metrics']['security_score']['improvement']:.1f} points")
-        print(f"  Device Compliance Improvement: {comparison['security_metrics']['device_compliance']['improvement']:.1f}%")
-        print(f"  Authentication Improvement: {comparison['security_metrics']['authentication_success']['improvement']:.1f}%")
-        
-        print("\nUsability Impact:")
+        breach = comparison['breach_prevention']
+        security = comparison['security_metrics']
         usability_change = comparison['usability_metrics']['usability_score']['change']
-        print(f"  Usability Score Change: {usability_change:.1f} points")
-        
-        print("\n[SUCCESS] Experiment completed successfully!")
-        print(f"  Results saved to: {runner.results_dir}/")
+        print(f"\n{'='*80}\n"
+              "EXPERIMENT RESULTS SUMMARY\n"
+              f"{'='*80}\n"
+              "\nBreach Prevention:\n"
+              f"  Baseline Rate: {breach['baseline_rate']*100:.1f}%\n"
+              f"  ZTA Rate: {breach['zta_rate']*100:.1f}%\n"
+              f"  Improvement: {breach['improvement_percent']:.1f}%\n"
+              "\nSecurity Metrics:\n"
+              f"  Security Score Improvement: {security['security_score']['improvement']:.1f} points\n"
+              f"  Device Compliance Improvement: {security['device_compliance']['improvement']:.1f}%\n"
+              f"  Authentication Improvement: {security['authentication_success']['improvement']:.1f}%\n"
+              "\nUsability Impact:\n"
+              f"  Usability Score Change: {usability_change:.1f} points\n"
+              "\n[SUCCESS] Experiment completed successfully!\n"
+              f"  Results saved to: {runner.results_dir}/")
         
         return 0
         
@@ -1,11 +1,26 @@
 """
 Security Breach Simulator for ZTA Testing
 """
+import contextlib
+import copy
+import io
+import os
 import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import config
 
+# Scenario methods run, in order, by each iteration
+BREACH_SCENARIOS = ('simulate_lateral_movement', 'simulate_credential_theft', 'simulate_insider_threat',
+                    'simulate_device_compromise', 'simulate_privilege_escalation')
+
+LOW_PRIVILEGE_ROLES = frozenset(('employee', 'contractor'))  # Roles used as insiders and escalation attackers
+
+_worker_environment = None  # Set in each worker process; copied afresh for every iteration it runs
+
 
 class BreachSimulator:
     """Simulates various security breach scenarios to test ZTA effectiveness"""
@@ -16,6 +31,46 @@ class BreachSimulator:
         self.successful_breaches = []
         self.prevented_breaches = []
         
+        # Per-type and per-method tallies, kept up to date as results are recorded
+        self._type_total = Counter()
+        self._type_prevented = Counter()
+        self._method_counter = Counter()
+        
+        # Target lists by name, each with the number of environment entries it was built from
+        self._targets: Dict[str, Tuple[int, List]] = {}
+    
+    def _record_result(self, result: Dict):
+        """Add a scenario result to the attempt lists and tallies"""
+        btype = result['breach_type']
+        self.breach_attempts.append(result)
+        self._type_total[btype] += 1
+        if result['prevented']:
+            self.prevented_breaches.append(result)
+            self._type_prevented[btype] += 1
+            self._method_counter.update(result['prevention_method'])
+        else:
+            self.successful_breaches.append(result)
+    
+    def _select_targets(self, name: str, items: List, keep) -> List:
+        """Items passing keep, cached until the number of items changes"""
+        cached = self._targets.get(name)
+        if cached is None or cached[0] != len(items):
+            cached = self._targets[name] = (len(items), [item for item in items if keep(item)])
+        return cached[1]
+    
+    @property
+    def _sensitive_apps(self) -> List:
+        """High or critical security applications, or every application if there are none"""
+        applications = self.environment.applications
+        return self._select_targets('sensitive_apps', applications,
+                                    lambda a: a.security_level in config.HIGH_SECURITY_LEVELS) or applications
+    
+    @property
+    def _low_priv_users(self) -> List:
+        """Users whose role is an employee or contractor"""
+        return self._select_targets('low_priv_users', self.environment.users,
+                                    lambda u: u.role in LOW_PRIVILEGE_ROLES)
+    
     def simulate_lateral_movement(self) -> Dict:
         """Simulate lateral movement attack"""
         print("\n[BREACH TEST] Simulating Lateral Movement Attack...")
@@ -42,17 +97,15 @@ class BreachSimulator:
         # or we can check if the environment is in ZTA mode.
         # Better approach: Check if access would be granted under current policies.
         
-        if target_app.security_level in ['high', 'critical'] and micro_segmentation_enabled:
+        if target_app.security_level in config.HIGH_SECURITY_LEVELS and micro_segmentation_enabled:
             result['prevention_method'].append('Micro-segmentation')
             result['prevention_method'].append('Access control policies')
-            self.prevented_breaches.append(result)
             print(f"  [PREVENTED] Micro-segmentation blocked lateral movement to {target_app.name}")
         else:
             result['prevented'] = False
-            self.successful_breaches.append(result)
             print(f"  [BREACH] Lateral movement succeeded to {target_app.name}")
         
-        self.breach_attempts.append(result)
+        self._record_result(result)
         return result
     
     def simulate_credential_theft(self) -> Dict:
@@ -89,29 +142,22 @@ class BreachSimulator:
         if require_compliant_device and (not device_validation['valid'] or victim.authentication_method in ['mfa', 'biometric']):
             result['prevention_method'].append('MFA requirement')
             result['prevention_method'].append('Device trust validation')
-            self.prevented_breaches.append(result)
             print(f"  [PREVENTED] MFA and device validation blocked credential theft")
         else:
             result['prevented'] = False
-            self.successful_breaches.append(result)
             print(f"  [BREACH] Credential theft succeeded")
         
-        self.breach_attempts.append(result)
+        self._record_result(result)
         return result
     
     def simulate_insider_threat(self) -> Dict:
         """Simulate insider threat scenario"""
         print("\n[BREACH TEST] Simulating Insider Threat...")
         
-        insider = random.choice([u for u in self.environment.users if u.role in ['employee', 'contractor']])
-        
-        # Try to find critical or high security apps
-        sensitive_apps = [a for a in self.environment.applications 
-                         if a.security_level in ['critical', 'high']]
-        if not sensitive_apps:
-            sensitive_apps = self.environment.applications
+        insider = random.choice(self._low_priv_users)
         
-        sensitive_app = random.choice(sensitive_apps)
+        # Target a critical or high security app
+        sensitive_app = random.choice(self._sensitive_apps)
         
         result = {
             'breach_type': 'insider_threat',
@@ -127,12 +173,12 @@ class BreachSimulator:
         auth_result = self.environment.identity_manager.authenticate_user(
             insider.user_id,
             'password123',
-            '123456' if insider.authentication_method == 'mfa' else None
+            insider.mfa_token
         )
         
         if auth_result['success']:
             # Try to access sensitive application
-            user_devices = [d for d in self.environment.devices if d.owner_id == insider.user_id]
+            user_devices = self.environment.devices_by_owner.get(insider.user_id)
             if not user_devices:
                 user_devices = [random.choice(self.environment.devices)]
             device = random.choice(user_devices)
@@ -147,18 +193,15 @@ class BreachSimulator:
             if not access_result['access_granted']:
                 result['prevention_method'].append('Role-based access control')
                 result['prevention_method'].append('Least privilege principle')
-                self.prevented_breaches.append(result)
                 print(f"  [PREVENTED] RBAC blocked insider access to {sensitive_app.name}")
             else:
                 result['prevented'] = False
-                self.successful_breaches.append(result)
                 print(f"  [BREACH] Insider accessed {sensitive_app.name}")
         else:
             result['prevention_method'].append('Authentication failure')
-            self.prevented_breaches.append(result)
             print(f"  [PREVENTED] Authentication failed for insider")
         
-        self.breach_attempts.append(result)
+        self._record_result(result)
         return result
     
     def simulate_device_compromise(self) -> Dict:
@@ -194,34 +237,25 @@ class BreachSimulator:
             if require_compliant and min_trust > 0:
                 result['prevention_method'].append('Device posture validation')
                 result['prevention_method'].append('Trust score enforcement')
-                self.prevented_breaches.append(result)
                 print(f"  [PREVENTED] Device posture check blocked compromised device")
             else:
                 result['prevented'] = False
-                self.successful_breaches.append(result)
                 print(f"  [BREACH] Compromised device gained access (Compliance check disabled)")
         else:
             result['prevented'] = False
-            self.successful_breaches.append(result)
             print(f"  [BREACH] Compromised device gained access")
         
-        self.breach_attempts.append(result)
+        self._record_result(result)
         return result
     
     def simulate_privilege_escalation(self) -> Dict:
         """Simulate privilege escalation attack"""
         print("\n[BREACH TEST] Simulating Privilege Escalation...")
         
-        low_priv_user = random.choice([u for u in self.environment.users 
-                                       if u.role in ['employee', 'contractor']])
+        low_priv_user = random.choice(self._low_priv_users)
         
-        # Try to find critical or high security apps
-        high_sec_apps = [a for a in self.environment.applications 
-                        if a.security_level in ['critical', 'high']]
-        if not high_sec_apps:
-            high_sec_apps = self.environment.applications
-        
-        admin_app = random.choice(high_sec_apps)
+        # Target a critical or high security app
+        admin_app = random.choice(self._sensitive_apps)
         
         result = {
             'breach_type': 'privilege_escalation',
@@ -236,12 +270,11 @@ class BreachSimulator:
         auth_result = self.environment.identity_manager.authenticate_user(
             low_priv_user.user_id,
             'password123',
-            '123456' if low_priv_user.authentication_method == 'mfa' else None
+            low_priv_user.mfa_token
         )
         
         if auth_result['success']:
-            user_devices = [d for d in self.environment.devices 
-                           if d.owner_id == low_priv_user.user_id]
+            user_devices = self.environment.devices_by_owner.get(low_priv_user.user_id)
             if not user_devices:
                 user_devices = [random.choice(self.environment.devices)]
             device = random.choice(user_devices)
@@ -256,17 +289,14 @@ class BreachSimulator:
             if not access_result['access_granted']:
                 result['prevention_method'].append('Access level enforcement')
                 result['prevention_method'].append('Continuous authorization')
-                self.prevented_breaches.append(result)
                 print(f"  [PREVENTED] Access control blocked privilege escalation")
             else:
                 result['prevented'] = False
-                self.successful_breaches.append(result)
                 print(f"  [BREACH] Privilege escalation succeeded")
         else:
             result['prevention_method'].append('Authentication failure')
-            self.prevented_breaches.append(result)
         
-        self.breach_attempts.append(result)
+        self._record_result(result)
         return result
     
     def run_all_breach_scenarios(self, iterations: int = 5):
@@ -278,11 +308,37 @@ class BreachSimulator:
         for i in range(iterations):
             print(f"\n--- Iteration {i+1}/{iterations} ---")
             
-            self.simulate_lateral_movement()
-            self.simulate_credential_theft()
-            self.simulate_insider_threat()
-            self.simulate_device_compromise()
-            self.simulate_privilege_escalation()
+            for scenario in BREACH_SCENARIOS:
+                getattr(self, scenario)()
+        
+        print("\n" + "=" * 70)
+        print("BREACH SIMULATION COMPLETE")
+        print("=" * 70)
+        
+        self._print_breach_summary()
+    
+    def run_all_breach_scenarios_parallel(self, iterations: int = 5, n_cores: Optional[int] = None,
+                                          seed: Optional[int] = None):
+        """
+        Run all breach scenarios with the iterations spread over worker processes.
+        Each iteration is seeded with seed + its index and runs on a fresh copy of the
+        environment, so results do not depend on how iterations are split over workers
+        and side effects of the scenarios are not applied to self.environment.
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        jobs = [(i, iterations, seed + i) for i in range(iterations)]
+        
+        print("\n" + "=" * 70)
+        print("RUNNING COMPREHENSIVE BREACH SIMULATION")
+        print("=" * 70)
+        
+        with ProcessPoolExecutor(max_workers=n_cores or os.cpu_count(), initializer=_init_worker,
+                                 initargs=(self.environment,)) as pool:
+            for results, output in pool.map(_run_iteration, jobs):
+                sys.stdout.write(output)
+                for result in results:
+                    self._record_result(result)
         
         print("\n" + "=" * 70)
         print("BREACH SIMULATION COMPLETE")
@@ -308,41 +364,43 @@ class BreachSimulator:
         print(f"\n{'Breach Type':<25} {'Attempts':<10} {'Prevented':<10} {'Success Rate'}")
         print("-" * 70)
         
-        breach_types = {}
-        for attempt in self.breach_attempts:
-            btype = attempt['breach_type']
-            if btype not in breach_types:
-                breach_types[btype] = {'total': 0, 'prevented': 0}
-            breach_types[btype]['total'] += 1
-            if attempt['prevented']:
-                breach_types[btype]['prevented'] += 1
-        
-        for btype, stats in breach_types.items():
-            success_rate = (stats['total'] - stats['prevented']) / stats['total'] * 100
-            print(f"{btype:<25} {stats['total']:<10} {stats['prevented']:<10} {success_rate:.1f}%")
+        for btype, total in self._type_total.items():
+            type_prevented = self._type_prevented[btype]
+            success_rate = (total - type_prevented) / total * 100
+            print(f"{btype:<25} {total:<10} {type_prevented:<10} {success_rate:.1f}%")
     
     def get_breach_statistics(self) -> Dict:
         """Get detailed breach statistics"""
         total = len(self.breach_attempts)
         prevented = len(self.prevented_breaches)
         
-        # Prevention methods effectiveness
-        prevention_methods = {}
-        for breach in self.prevented_breaches:
-            for method in breach['prevention_method']:
-                prevention_methods[method] = prevention_methods.get(method, 0) + 1
-        
-        # Breach type distribution
-        breach_distribution = {}
-        for attempt in self.breach_attempts:
-            btype = attempt['breach_type']
-            breach_distribution[btype] = breach_distribution.get(btype, 0) + 1
-        
         return {
             'total_attempts': total,
             'prevented': prevented,
             'successful': len(self.successful_breaches),
             'prevention_rate': prevented / total if total > 0 else 0,
-            'prevention_methods': prevention_methods,
-            'breach_distribution': breach_distribution
+            'prevention_methods': dict(self._method_counter),
+            'breach_distribution': dict(self._type_total)
         }
+
+
+def _init_worker(environment):
+    """Keep the environment a worker process was started with"""
+    global _worker_environment
+    _worker_environment = environment
+
+
+def _run_iteration(job):
+    """Run one job of run_all_breach_scenarios_parallel in a worker process"""
+    return _run_seeded_iteration(_worker_environment, *job)
+
+
+def _run_seeded_iteration(environment, iteration: int, iterations: int, seed: int):
+    """Run every scenario once, seeded, on a fresh copy of the environment; return the results and printed output"""
+    simulator = BreachSimulator(copy.deepcopy(environment))
+    random.seed(seed)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        print(f"\n--- Iteration {iteration+1}/{iterations} ---")
+        results = [getattr(simulator, scenario)() for scenario in BREACH_SCENARIOS]
+    return results, output.getvalue()
@@ -5,14 +5,20 @@ instead of fully random generation for scientific rigor.
 """
 import random
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
+import numpy as np
 from faker import Faker
 
-from models import User, Device, Application
+from models import User, UserRegistry, Device, DeviceRegistry, Application, sim_clock
 from core import IdentityManager, DeviceManager, AccessController, MonitoringSystem
-from simulation.realistic_behavior_generator import RealisticBehaviorGenerator
+from simulation.realistic_behavior_generator import RealisticBehaviorGenerator, IP_POOL_SIZE
 import config
 
+# Event handlers of the random (fallback) simulation and the probability of each
+RANDOM_EVENT_HANDLERS = ('_simulate_authentication', '_simulate_access_request',
+                         '_simulate_device_check', '_simulate_anomalous_behavior')
+RANDOM_EVENT_WEIGHTS = np.array([0.4, 0.45, 0.10, 0.05])
+
 
 class HybridWorkEnvironment:
     """
@@ -22,6 +28,7 @@ class HybridWorkEnvironment:
     
     def __init__(self, use_realistic_generation: bool = True):
         self.faker = Faker()
+        self._ip_pool = [self.faker.ipv4() for _ in range(IP_POOL_SIZE)]  # Drawn from per authentication event
         self.use_realistic_generation = use_realistic_generation
         
         # Initialize core components
@@ -31,8 +38,11 @@ class HybridWorkEnvironment:
         self.monitoring_system = MonitoringSystem()
         
         # Data stores
+        self.user_registry = UserRegistry()  # Columnar authentication state of this environment's users
+        self.device_registry = DeviceRegistry()  # Columnar state of this environment's devices
         self.users = []
         self.devices = []
+        self.devices_by_owner: Dict[str, List[Device]] = {}  # Owner user_id -> devices, in creation order
         self.applications = []
         
         # Realistic behavior generator (initialized after users/devices/apps are created)
@@ -41,6 +51,8 @@ class HybridWorkEnvironment:
         # Simulation state
         self.current_day = 0
         self.simulation_logs = []
+        self._day_metrics = self.monitoring_system.pending_metrics  # Metric counts not yet folded into the totals
+        self._session_tokens: Dict[str, bytes] = {}  # Random simulation's session per user, for the current day
         
         # Track training vs testing phase to avoid circular logic
         self.training_phase = True
@@ -81,7 +93,8 @@ class HybridWorkEnvironment:
                 name=self.faker.name(),
                 role=random.choice(config.USER_ROLES),
                 location=random.choice(config.WORK_LOCATIONS),
-                department=random.choice(departments)
+                department=random.choice(departments),
+                registry=self.user_registry
             )
             
             self.users.append(user)
@@ -91,18 +104,26 @@ class HybridWorkEnvironment:
         """Create simulated devices"""
         os_versions = ['Windows 11', 'Windows 10', 'macOS 13', 'macOS 12', 'Ubuntu 22.04', 'iOS 16', 'Android 13']
         
-        for i in range(config.NUM_DEVICES):
+        owners, device_types, device_os_versions = [], [], []
+        for _ in range(config.NUM_DEVICES):
             # Assign device to a random user
-            owner = random.choice(self.users)
-            
-            device = Device(
-                device_id=f"DEV-{i+1:04d}",
-                device_type=random.choice(config.DEVICE_TYPES),
-                owner_id=owner.user_id,
-                os_version=random.choice(os_versions)
-            )
-            
+            owners.append(random.choice(self.users))
+            device_types.append(random.choice(config.DEVICE_TYPES))
+            device_os_versions.append(random.choice(os_versions))
+        
+        # Device state is drawn in bulk, seeded from the random module so seeded runs stay reproducible
+        devices = Device.bulk_create(
+            device_ids=[f"DEV-{i+1:04d}" for i in range(config.NUM_DEVICES)],
+            device_types=device_types,
+            owner_ids=[owner.user_id for owner in owners],
+            os_versions=device_os_versions,
+            registry=self.device_registry,
+            rng=np.random.default_rng(random.getrandbits(64))
+        )
+        
+        for owner, device in zip(owners, devices):
             self.devices.append(device)
+            self.devices_by_owner.setdefault(owner.user_id, []).append(device)
             self.device_manager.register_device(device)
     
     def _create_applications(self):
@@ -139,14 +160,27 @@ class HybridWorkEnvironment:
         Simulate one day of activity in the hybrid work environment.
         Uses realistic behavior generation if enabled.
         """
-        self.current_day = day_number
-        
-        # Use realistic generation if enabled
+        self.simulate_days((day_number,))
+    
+    def simulate_days(self, day_numbers: Iterable[int]):
+        """
+        Simulate a run of consecutive days. Days depend on the state left by the
+        previous one, so they still run in order; the generator choice and clock
+        release are done once for the whole run.
+        """
+        # Use realistic generation if enabled, else fall back to original random generation
         if self.use_realistic_generation and self.behavior_generator:
-            self._simulate_day_realistic(day_number)
+            simulate = self._simulate_day_realistic
         else:
-            # Fallback to original random generation
-            self._simulate_day_random()
+            simulate = self._simulate_day_random
+        try:
+            for day_number in day_numbers:
+                self.current_day = day_number
+                self._session_tokens.clear()  # Users sign in afresh each day
+                simulate(day_number)
+                self.monitoring_system.flush_metrics()
+        finally:
+            sim_clock.release()
     
     def _simulate_day_realistic(self, day_number: int):
         """Simulate day using realistic behavior generation"""
@@ -156,6 +190,7 @@ class HybridWorkEnvironment:
         )
         
         for event in events:
+            sim_clock.tick()  # One model timestamp per event
             event_type = event.get('event_type', 'authentication')
             
             if event_type == 'authentication':
@@ -169,22 +204,18 @@ class HybridWorkEnvironment:
                 if random.random() < 0.05:  # 5% chance of anomaly
                     self._simulate_anomalous_behavior()
     
-    def _simulate_day_random(self):
-        """Original random simulation (fallback)"""
-        for _ in range(config.EVENTS_PER_DAY):
-            event_type = random.choices(
-                ['authentication', 'access_request', 'device_check', 'anomaly'],
-                weights=[0.4, 0.45, 0.10, 0.05]
-            )[0]
-            
-            if event_type == 'authentication':
-                self._simulate_authentication()
-            elif event_type == 'access_request':
-                self._simulate_access_request()
-            elif event_type == 'device_check':
-                self._simulate_device_check()
-            elif event_type == 'anomaly':
-                self._simulate_anomalous_behavior()
+    def _simulate_day_random(self, day_number: int, rng: Optional[np.random.Generator] = None):
+        """
+        Original random simulation (fallback); the day's event types are drawn in one batch.
+        day_number is unused and only matches _simulate_day_realistic's signature.
+        """
+        if rng is None:
+            # Seeded from the random module so seeded runs stay reproducible
+            rng = np.random.default_rng(random.getrandbits(64))
+        handlers = [getattr(self, name) for name in RANDOM_EVENT_HANDLERS]
+        for event in rng.choice(len(handlers), size=config.EVENTS_PER_DAY, p=RANDOM_EVENT_WEIGHTS).tolist():
+            sim_clock.tick()  # One model timestamp per event
+            handlers[event]()
     
     def _simulate_authentication_realistic(self, event: Dict):
         """Simulate authentication using realistic event data"""
@@ -198,7 +229,7 @@ class HybridWorkEnvironment:
         result = self.identity_manager.authenticate_user(
             user.user_id,
             'password123',
-            '123456' if user.authentication_method == 'mfa' else None,
+            user.mfa_token,
             context
         )
         
@@ -206,11 +237,12 @@ class HybridWorkEnvironment:
         self.monitoring_system.log_event(
             'authentication',
             'low' if result['success'] else 'medium',
-            f"Authentication {'successful' if result['success'] else 'failed'} for user {user.user_id}",
-            {'user_id': user.user_id, 'device_id': device.device_id}
+            "Authentication %s for user %s",
+            {'user_id': user.user_id, 'device_id': device.device_id},
+            args=('successful' if result['success'] else 'failed', user.user_id)
         )
         
-        self.monitoring_system.metrics['authentication_events'] += 1
+        self._day_metrics['authentication_events'] += 1
         
         # Record activity for sequence-based generation
         if self.behavior_generator:
@@ -235,7 +267,7 @@ class HybridWorkEnvironment:
         auth_result = self.identity_manager.authenticate_user(
             user.user_id,
             'password123',
-            '123456' if user.authentication_method == 'mfa' else None
+            user.mfa_token
         )
         
         if not auth_result['success']:
@@ -256,19 +288,20 @@ class HybridWorkEnvironment:
         self.monitoring_system.log_event(
             'access_request',
             'low' if access_result['access_granted'] else 'medium',
-            f"Access {'granted' if access_result['access_granted'] else 'denied'} for {user.user_id} to {application.name}",
+            "Access %s for %s to %s",
             {
                 'user_id': user.user_id,
                 'device_id': device.device_id,
                 'app_id': application.app_id,
                 'granted': access_result['access_granted']
-            }
+            },
+            args=('granted' if access_result['access_granted'] else 'denied', user.user_id, application.name)
         )
         
-        self.monitoring_system.metrics['access_requests'] += 1
+        self._day_metrics['access_requests'] += 1
         
         if not access_result['access_granted']:
-            self.monitoring_system.metrics['policy_violations'] += 1
+            self._day_metrics['policy_violations'] += 1
         
         # Record activity for sequence-based generation
         if self.behavior_generator:
@@ -280,19 +313,19 @@ class HybridWorkEnvironment:
     def _simulate_authentication(self):
         """Simulate user authentication attempt"""
         user = random.choice(self.users)
-        device = random.choice([d for d in self.devices if d.owner_id == user.user_id] or self.devices)
+        device = random.choice(self.devices_by_owner.get(user.user_id) or self.devices)
         
         # Simulate authentication
         context = {
             'device_id': device.device_id,
             'location': user.location,
-            'ip_address': self.faker.ipv4()
+            'ip_address': self.faker.random.choice(self._ip_pool)
         }
         
         result = self.identity_manager.authenticate_user(
             user.user_id,
             'password123',  # Simulated password
-            '123456' if user.authentication_method == 'mfa' else None,
+            user.mfa_token,
             context
         )
         
@@ -300,31 +333,35 @@ class HybridWorkEnvironment:
         self.monitoring_system.log_event(
             'authentication',
             'low' if result['success'] else 'medium',
-            f"Authentication {'successful' if result['success'] else 'failed'} for user {user.user_id}",
-            {'user_id': user.user_id, 'device_id': device.device_id}
+            "Authentication %s for user %s",
+            {'user_id': user.user_id, 'device_id': device.device_id},
+            args=('successful' if result['success'] else 'failed', user.user_id)
         )
         
-        self.monitoring_system.metrics['authentication_events'] += 1
+        self._day_metrics['authentication_events'] += 1
         
         return result
     
     def _simulate_access_request(self):
         """Simulate access request to an application"""
         user = random.choice(self.users)
-        device = random.choice([d for d in self.devices if d.owner_id == user.user_id] or self.devices)
+        device = random.choice(self.devices_by_owner.get(user.user_id) or self.devices)
         application = random.choice(self.applications)
         
-        # First authenticate
-        auth_result = self.identity_manager.authenticate_user(
-            user.user_id,
-            'password123',
-            '123456' if user.authentication_method == 'mfa' else None
-        )
-        
-        if not auth_result['success']:
-            return
-        
-        session_token = auth_result['session_token']
+        # Reuse the user's session while it is valid; authenticate only when there is none
+        session_token = self._session_tokens.get(user.user_id)
+        if session_token is None or not self.identity_manager.validate_session(session_token)['valid']:
+            auth_result = self.identity_manager.authenticate_user(
+                user.user_id,
+                'password123',
+                user.mfa_token
+            )
+            
+            if not auth_result['success']:
+                return
+            
+            session_token = auth_result['session_token']
+            self._session_tokens[user.user_id] = session_token
         
         # Request access
         context = {
@@ -344,19 +381,20 @@ class HybridWorkEnvironment:
         self.monitoring_system.log_event(
             'access_request',
             'low' if access_result['access_granted'] else 'medium',
-            f"Access {'granted' if access_result['access_granted'] else 'denied'} for {user.user_id} to {application.name}",
+            "Access %s for %s to %s",
             {
                 'user_id': user.user_id,
                 'device_id': device.device_id,
                 'app_id': application.app_id,
                 'granted': access_result['access_granted']
-            }
+            },
+            args=('granted' if access_result['access_granted'] else 'denied', user.user_id, application.name)
         )
         
-        self.monitoring_system.metrics['access_requests'] += 1
+        self._day_metrics['access_requests'] += 1
         
         if not access_result['access_granted']:
-            self.monitoring_system.metrics['policy_violations'] += 1
+            self._day_metrics['policy_violations'] += 1
     
     def _simulate_device_check(self):
         """Simulate device posture check"""
@@ -368,20 +406,21 @@ class HybridWorkEnvironment:
         self.monitoring_system.log_event(
             'device_posture_check',
             'low' if result['compliant'] else 'high',
-            f"Device {device.device_id} posture check: {'compliant' if result['compliant'] else 'non-compliant'}",
+            "Device %s posture check: %s",
             {
                 'device_id': device.device_id,
                 'trust_score': result['trust_score'],
                 'compliant': result['compliant']
-            }
+            },
+            args=(device.device_id, 'compliant' if result['compliant'] else 'non-compliant')
         )
         
-        self.monitoring_system.metrics['device_posture_checks'] += 1
+        self._day_metrics['device_posture_checks'] += 1
     
     def _simulate_anomalous_behavior(self):
         """Simulate anomalous user behavior"""
         user = random.choice(self.users)
-        device = random.choice([d for d in self.devices if d.owner_id == user.user_id] or self.devices)
+        device = random.choice(self.devices_by_owner.get(user.user_id) or self.devices)
         
         behavior_data = {
             'access_rate': random.randint(5, 20),
@@ -397,7 +436,7 @@ class HybridWorkEnvironment:
         )
         
         if anomaly_result['is_anomalous']:
-            self.monitoring_system.metrics['security_incidents'] += 1
+            self._day_metrics['security_incidents'] += 1
     
     def run_simulation(self, days: int = None):
         """Run the complete simulation"""
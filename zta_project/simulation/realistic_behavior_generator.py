@@ -9,8 +9,11 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from collections import defaultdict
+from faker import Faker
 import config
 
+IP_POOL_SIZE = 256  # Faker addresses generated up front; events draw from them instead of calling Faker
+
 
 class RealisticBehaviorGenerator:
     """
@@ -24,6 +27,13 @@ class RealisticBehaviorGenerator:
         self.users = users
         self.devices = devices
         self.applications = applications
+        self.faker = Faker()  # Reused for every generated event (construction is expensive)
+        self._ip_pool = [self.faker.ipv4() for _ in range(IP_POOL_SIZE)]
+        
+        # Owner user_id -> devices, in the order given
+        self.devices_by_owner = {}
+        for device in devices:
+            self.devices_by_owner.setdefault(device.owner_id, []).append(device)
         
         # Role-based resource access patterns
         self.role_resource_mapping = self._initialize_role_patterns()
@@ -59,7 +69,7 @@ class RealisticBehaviorGenerator:
             preferred_resources = self.role_resource_mapping.get(user.role, ['Email System', 'File Share'])
             
             # Primary device (most used)
-            user_devices = [d for d in self.devices if d.owner_id == user.user_id]
+            user_devices = self.devices_by_owner.get(user.user_id)
             primary_device = user_devices[0] if user_devices else random.choice(self.devices)
             
             # Typical location (most common)
@@ -159,7 +169,7 @@ class RealisticBehaviorGenerator:
                 return None
         
         # Select device (prefer primary device, but allow others)
-        user_devices = [d for d in self.devices if d.owner_id == user.user_id]
+        user_devices = self.devices_by_owner.get(user.user_id)
         if not user_devices:
             user_devices = [random.choice(self.devices)]
         
@@ -204,7 +214,7 @@ class RealisticBehaviorGenerator:
             return None
         
         # Select device
-        user_devices = [d for d in self.devices if d.owner_id == user.user_id]
+        user_devices = self.devices_by_owner.get(user.user_id)
         if not user_devices:
             user_devices = [random.choice(self.devices)]
         
@@ -303,10 +313,8 @@ class RealisticBehaviorGenerator:
     
     def _generate_realistic_ip(self, location: str) -> str:
         """Generate realistic IP address based on location"""
-        # Simplified: just generate IP, but could be location-specific
-        from faker import Faker
-        faker = Faker()
-        return faker.ipv4()
+        # Simplified: just pick a pooled IP, but could be location-specific
+        return self.faker.random.choice(self._ip_pool)
     
     def record_activity(self, user_id: str, activity: Dict):
         """Record user activity for sequence-based generation"""
@@ -22,7 +22,7 @@ class UsabilityTester:
         start_time = time.time()
         
         # Get user's device
-        user_devices = [d for d in self.environment.devices if d.owner_id == user.user_id]
+        user_devices = self.environment.devices_by_owner.get(user.user_id)
         if not user_devices:
             user_devices = [random.choice(self.environment.devices)]
         device = random.choice(user_devices)
@@ -49,7 +49,7 @@ class UsabilityTester:
             auth_result = self.environment.identity_manager.authenticate_user(
                 user.user_id,
                 'password123',
-                '123456' if user.authentication_method == 'mfa' else None
+                user.mfa_token
             )
             authenticated = auth_result['success']
             